@@ -5,29 +5,68 @@
 提供用户登录、注册等API接口
 """
 
-import pymysql
+import base64
+import gzip
 import json
 import os
+import queue
 import re
+import sys
+import tempfile
+import hmac
 import logging
 import hashlib
+import threading
+import time
 import pandas as pd
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+from datetime import datetime
 import uuid
-from functools import wraps
+from functools import lru_cache, wraps
+from operator import itemgetter
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, g, has_request_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from werkzeug.security import generate_password_hash, check_password_hash
 import jwt
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 优先使用C扩展实现的mysqlclient驱动，行解析更快；未安装时使用纯Python的pymysql，
+# 两者接口一致。在gevent协程worker中（socket已被monkey patch）必须使用pymysql，
+# 它通过socket读写，等待数据库时会让出协程，mysqlclient则会阻塞整个进程
+gevent_monkey = sys.modules.get("gevent.monkey")
+GEVENT_PATCHED = bool(gevent_monkey and gevent_monkey.is_module_patched("socket"))
+try:
+    if GEVENT_PATCHED:
+        raise ImportError("gevent环境下使用pymysql")
+    import MySQLdb as mysql_driver
+    import MySQLdb.cursors
+    from MySQLdb.constants import CLIENT, ER
+
+    MYSQLCLIENT_AVAILABLE = True
+except ImportError:
+    import pymysql as mysql_driver
+    import pymysql.cursors
+    from pymysql.constants import CLIENT, ER
+
+    MYSQLCLIENT_AVAILABLE = False
+
 # 导入量化交易系统的数据准备和回测模块
 from prepare_strategy_data import DataPreparer
 from backtest_engine import BacktestEngine
 import pandas as pd
 
-# 配置日志
+# 配置日志，级别由环境变量LOG_LEVEL指定，未设置时只输出WARNING及以上
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    level=os.environ.get("LOG_LEVEL", "WARNING").upper(),
+    format="%(asctime)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
@@ -36,18 +75,123 @@ app = Flask(__name__)
 CORS(app)
 
 
+def json_dumps(obj):
+    """序列化为JSON字符串，安装了orjson时优先使用"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_loads(s):
+    """解析JSON字符串或字节串，安装了orjson时优先使用"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def encode_page_cursor(values):
+    """将上一页最后一行的排序键编码为分页游标"""
+    return base64.urlsafe_b64encode(json_dumps(list(values)).encode("utf-8")).decode(
+        "ascii"
+    )
+
+
+def decode_page_cursor(cursor, size):
+    """解析分页游标，格式不正确时抛出ValueError"""
+    try:
+        values = json_loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise ValueError("无效的分页游标")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("无效的分页游标")
+    return values
+
+
+def page_count(total, page_size):
+    """按总数计算总页数（向上取整），未统计总数时返回None"""
+    if total is None:
+        return None
+    return -(-total // page_size)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """基于orjson的JSON提供器，日期、Decimal等类型仍按Flask默认规则转换"""
+
+    def _dumps_bytes(self, obj, sort_keys, indent):
+        option = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+        )
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(
+            obj, kwargs.get("sort_keys", self.sort_keys), kwargs.get("indent")
+        ).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """序列化为JSON响应，orjson输出的字节串直接作为响应体，不再解码再编码"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = self._dumps_bytes(obj, self.sort_keys, indent)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
+if ORJSON_AVAILABLE:
+    # 所有jsonify响应和request.get_json都改用orjson
+    app.json = ORJSONProvider(app)
+
+
+# 超过该大小的JSON响应在客户端支持时gzip压缩后返回
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 5
+
+
+@app.after_request
+def gzip_json_response(response):
+    """压缩较大的JSON响应（指标代码、描述等文本压缩率很高），已压缩的响应保持不变"""
+    if (
+        response.mimetype != "application/json"
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or not 200 <= response.status_code < 300
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    # 按q值判断，"gzip;q=0"表示客户端明确拒绝gzip
+    if request.accept_encodings["gzip"] <= 0:
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
 # 加载配置文件
+@lru_cache(maxsize=1)
 def load_config():
-    """加载配置文件"""
+    """加载配置文件（每个进程只读取一次）"""
     config_path = os.path.join(os.path.dirname(__file__), "config.json")
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(config_path, "rb") as f:
+            return json_loads(f.read())
     except FileNotFoundError:
-        logger.error(f"配置文件未找到: {config_path}")
+        logger.error("配置文件未找到: %s", config_path)
         raise
     except json.JSONDecodeError as e:
-        logger.error(f"配置文件格式错误: {e}")
+        logger.error("配置文件格式错误: %s", e)
         raise
 
 
@@ -56,39 +200,425 @@ config = load_config()
 
 # 配置项
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY") or "your-secret-key-here"
-app.config["JWT_EXPIRATION_DELTA"] = timedelta(hours=24)
+app.config["JWT_EXPIRATION_SECONDS"] = 24 * 60 * 60
+
+# 运行期间不变的密钥和JWT参数，提取为模块级常量，避免每次请求都查询app.config
+SECRET_KEY = app.config["SECRET_KEY"]
+SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
+JWT_EXPIRATION_SECONDS = app.config["JWT_EXPIRATION_SECONDS"]
+JWT_ALGORITHM = "HS256"
+JWT_ALGORITHMS = [JWT_ALGORITHM]
+
+# 名称格式校验（模块加载时预编译）
+# 用户名仅允许英文、数字、下划线；使用\Z而非$，避免末尾换行符通过校验
+USERNAME_RE = re.compile(r"^[A-Za-z0-9_]+\Z")
+# 参数ID仅允许字母、数字、下划线和点号
+PARAM_NAME_RE = re.compile(r"^[a-zA-Z0-9_.]+\Z")
+# 策略名称仅允许中文、英文、数字和下划线
+STRATEGY_NAME_RE = re.compile(r"^[\u4e00-\u9fa5a-zA-Z0-9_]+\Z")
+# 指标名称同样仅允许中文、英文、数字和下划线
+INDICATOR_NAME_RE = re.compile(r"^[\u4e00-\u9fa5a-zA-Z0-9_]+\Z")
+
+# 用户认证相关SQL语句（模块级常量，避免每次请求重新构造）
+# 时间字段在SQL中直接格式化为ISO 8601字符串（DATETIME不含小数秒，与isoformat()一致）
+SQL_LOGIN_SELECT = """
+SELECT user_id, user_name, user_password, user_role, user_status,
+       user_email, user_phone,
+       DATE_FORMAT(user_create_time, '%%Y-%%m-%%dT%%H:%%i:%%s') AS user_create_time
+FROM User WHERE user_name = %s AND user_status = 'active'
+"""
+# 一次取出SQL_LOGIN_SELECT查询结果中的各列
+LOGIN_USER_FIELDS = itemgetter(
+    "user_id",
+    "user_name",
+    "user_password",
+    "user_role",
+    "user_status",
+    "user_email",
+    "user_phone",
+    "user_create_time",
+)
+SQL_UPGRADE_PASSWORD = "UPDATE User SET user_password = %s WHERE user_id = %s"
+SQL_INSERT_USER = """
+INSERT INTO User (user_id, user_name, user_password, user_role, user_status, user_email, user_phone)
+VALUES (%s, %s, %s, 'analyst', 'active', %s, %s)
+"""
+SQL_GET_USER_INFO = """
+SELECT user_id, user_name, user_role, user_status, user_email, user_phone,
+       DATE_FORMAT(user_create_time, '%%Y-%%m-%%dT%%H:%%i:%%s') AS user_create_time,
+       DATE_FORMAT(user_last_login_time, '%%Y-%%m-%%dT%%H:%%i:%%s') AS user_last_login_time
+FROM User WHERE user_id = %s
+"""
+
+
+# 数据库连接池
+class PooledConnection:
+    """连接池中的连接包装，调用close()时将连接归还连接池而不是断开
+
+    request_scoped为True时表示该连接由整个请求共享，close()不做任何操作，
+    请求结束时由teardown统一调用release()归还。
+    """
+
+    def __init__(self, pool, connection, created_at, request_scoped=False):
+        self._pool = pool
+        self._connection = connection
+        self._created_at = created_at
+        self._request_scoped = request_scoped
+
+    def close(self):
+        if not self._request_scoped:
+            self.release()
+
+    def release(self):
+        if self._connection is not None:
+            self._pool.release(self._connection, self._created_at)
+            self._connection = None
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class ConnectionPool:
+    """线程安全的MySQL连接池，复用已建立的连接以避免每次请求都重新握手认证
+
+    size为最多保留的空闲连接数，maxconnections为同时借出的连接上限，
+    达到上限时等待其他请求归还，超过timeout秒仍未等到则抛出异常。
+    建立时间超过recycle秒的连接在取出时关闭并重建，避免被MySQL的wait_timeout断开。
+    """
+
+    def __init__(self, size, maxconnections, timeout=10, recycle=3600, **db_config):
+        self._db_config = db_config
+        self._size = size
+        self._maxconnections = maxconnections
+        self._timeout = timeout
+        self._recycle = recycle
+        # fork后从父进程继承的空闲连接，只保留引用，永不使用
+        self._inherited_connections = []
+        self._idle = queue.LifoQueue(maxsize=self._size)
+        self.reset()
+
+    def reset(self):
+        """停用所有空闲连接并重置借出计数，用于fork出的子进程
+
+        子进程继承的连接与父进程共用同一个套接字，关闭连接或连接对象被回收时
+        驱动会向服务端发送退出命令，断开父进程的连接，因此保留其引用，不关闭也不回收。
+        """
+        self._inherited_connections.extend(self._idle.queue)
+        self._idle = queue.LifoQueue(maxsize=self._size)
+        self._slots = threading.BoundedSemaphore(self._maxconnections)
+
+    def connection(self, request_scoped=False):
+        """从连接池取出一个连接，没有空闲连接时新建"""
+        if not self._slots.acquire(timeout=self._timeout):
+            raise RuntimeError("等待数据库连接超时，连接池已满")
+        try:
+            try:
+                connection, created_at = self._idle.get_nowait()
+            except queue.Empty:
+                connection, created_at = self._connect()
+            else:
+                if time.monotonic() - created_at > self._recycle:
+                    self._close(connection)
+                    connection, created_at = self._connect()
+                else:
+                    # 空闲连接仍可能被服务端断开，取出时检查，断开则重新建立
+                    try:
+                        connection.ping()
+                    except mysql_driver.MySQLError:
+                        self._close(connection)
+                        connection, created_at = self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+        return PooledConnection(self, connection, created_at, request_scoped)
+
+    def _connect(self):
+        return mysql_driver.connect(**self._db_config), time.monotonic()
+
+    @staticmethod
+    def _close(connection):
+        try:
+            connection.close()
+        except mysql_driver.MySQLError:
+            pass
+
+    def release(self, connection, created_at):
+        """归还连接，连接池已满或连接不可用时直接关闭"""
+        try:
+            # 回滚未提交的事务，避免下一个使用者读到旧的事务快照
+            connection.rollback()
+            self._idle.put_nowait((connection, created_at))
+        except (queue.Full, mysql_driver.MySQLError):
+            self._close(connection)
+        finally:
+            self._slots.release()
+
+
+# 同时借出的连接数默认按 2×CPU核数+4 估算：数据库并发超过这个量级后吞吐不再提升，
+# 多出的请求在连接池排队比挤到MySQL上更好。可在config.json中用db_max_connections覆盖
+DEFAULT_DB_MAX_CONNECTIONS = 2 * (os.cpu_count() or 1) + 4
+
+db_pool = ConnectionPool(
+    size=config.get("db_pool_size", 10),
+    maxconnections=config.get("db_max_connections", DEFAULT_DB_MAX_CONNECTIONS),
+    recycle=config.get("db_pool_recycle", 3600),
+    host="localhost",
+    port=3306,
+    user="root",
+    password=config["db_password"],
+    database="quantitative_trading",
+    charset="utf8mb4",
+    cursorclass=mysql_driver.cursors.DictCursor,
+    # UPDATE的rowcount返回匹配的行数而不是实际改动的行数，便于用rowcount判断记录是否存在
+    client_flag=CLIENT.FOUND_ROWS,
+)
+
+# gunicorn等以预加载方式fork工作进程时，每个工作进程使用自己的连接
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=db_pool.reset)
 
 
 # 数据库连接工具函数
 def get_db_connection():
-    """获取数据库连接"""
+    """从连接池获取数据库连接，使用完毕后调用close()归还
+
+    请求处理过程中多次获取得到的是同一个连接，请求结束时自动归还；
+    后台线程中每次获取一个独立的连接。
+    """
     try:
-        connection = pymysql.connect(
-            host="localhost",
-            port=3306,
-            user="root",
-            password=config["db_password"],
-            database="quantitative_trading",
-            charset="utf8mb4",
-            cursorclass=pymysql.cursors.DictCursor,
-        )
-        return connection
+        if not has_request_context():
+            return db_pool.connection()
+        if "db_connection" not in g:
+            g.db_connection = db_pool.connection(request_scoped=True)
+        return g.db_connection
     except Exception as e:
-        logger.error(f"数据库连接失败: {str(e)}")
+        logger.error("数据库连接失败: %s", e)
         raise
 
 
+@app.teardown_appcontext
+def release_db_connection(exception):
+    """请求结束时将本请求使用的连接归还连接池"""
+    connection = g.pop("db_connection", None)
+    if connection is not None:
+        connection.release()
+
+
+# 进程内缓存
+class TTLCache:
+    """线程安全的进程内缓存，条目在ttl秒后过期，超过maxsize时淘汰最早写入的条目"""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expire_at = item
+            if expire_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class SharedVersion:
+    """同一台机器上所有工作进程共享的数据版本号，保存在一个小文件中
+
+    进程内缓存只在处理写请求的进程中清空，其他工作进程仍会返回旧结果。
+    缓存键带上get()返回的版本号，写操作提交后调用bump()更换版本号，
+    各进程之后的查询都使用新键，写入前缓存的结果不会再被命中。
+    """
+
+    def __init__(self, path):
+        self._path = path
+        if not os.path.exists(path):
+            self.bump()
+
+    def get(self):
+        try:
+            with open(self._path, "rb") as f:
+                return f.read()
+        except OSError:
+            # 读不到版本号时返回随机值，相当于不使用缓存
+            return os.urandom(8)
+
+    def bump(self):
+        # 先写临时文件再原子替换，其他进程不会读到写了一半的内容
+        tmp_path = f"{self._path}.{os.getpid()}.{threading.get_ident()}"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(os.urandom(8).hex().encode())
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.error("更新缓存版本号失败: %s", e)
+
+
+# 缓存版本号文件所在目录，多个部署共用同一目录只会多一些缓存失效，不影响正确性
+CACHE_VERSION_DIR = config.get(
+    "cache_version_dir", os.path.join(tempfile.gettempdir(), "quant_trading_cache")
+)
+os.makedirs(CACHE_VERSION_DIR, exist_ok=True)
+
+
+# 已验证通过的token缓存，键为token的摘要，值为(current_user, exp)
+token_cache = TTLCache(maxsize=10000, ttl=60)
+
+# 用户信息缓存，键为user_id，用户信息变更后需调用user_info_cache.pop失效
+user_info_cache = TTLCache(maxsize=5000, ttl=30)
+
+
+class LastLoginWriter:
+    """在后台线程中批量写入用户最后登录时间，登录请求无需等待这次写库"""
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def record(self, user_id):
+        self._ensure_started()
+        self._queue.put(user_id)
+
+    def _ensure_started(self):
+        # 首次使用时才启动线程，避免在多进程部署的fork之前创建线程
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            # 同一用户在一个批次内多次登录时只更新一次
+            batch = {self._queue.get()}
+            time.sleep(self.interval)
+            while True:
+                try:
+                    batch.add(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._flush(batch)
+            except Exception as e:
+                # 数据库短暂不可用时等待一个周期后重试一次
+                logger.warning("批量更新最后登录时间失败，稍后重试: %s", e)
+                time.sleep(self.interval)
+                try:
+                    self._flush(batch)
+                except Exception as e:
+                    logger.error("批量更新最后登录时间失败: %s", e)
+
+    def _flush(self, batch):
+        # 时间取数据库的NOW()，与其他时间字段使用同一时钟；批次间隔不超过一秒，误差可忽略
+        placeholders = ", ".join(["%s"] * len(batch))
+        sql = (
+            "UPDATE User SET user_last_login_time = NOW() "
+            f"WHERE user_id IN ({placeholders})"
+        )
+        connection = get_db_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, list(batch))
+            connection.commit()
+        finally:
+            connection.close()
+        for user_id in batch:
+            user_info_cache.pop(user_id)
+
+
+last_login_writer = LastLoginWriter()
+
+
+def uuid7():
+    """生成按时间递增的UUIDv7，用作主键时新行总是追加在索引末尾，减少页分裂"""
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80 | int.from_bytes(
+        os.urandom(10), "big"
+    )
+    # 写入版本号7和RFC 4122变体标记
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+# 密码工具函数
+# 旧版本使用无盐MD5存储密码（32位16进制字符串），登录成功后会自动升级为加盐哈希
+LEGACY_MD5_RE = re.compile(r"^[0-9a-fA-F]{32}$")
+
+
+def hash_password(password):
+    """生成加盐的密码哈希（PBKDF2-SHA256）"""
+    return generate_password_hash(password, method="pbkdf2:sha256", salt_length=16)
+
+
+# 用户不存在时用于校验的占位哈希，使登录耗时与用户是否存在无关
+DUMMY_PASSWORD_HASH = hash_password(uuid.uuid4().hex)
+
+
+def is_legacy_password_hash(stored_hash):
+    """判断数据库中的密码是否为旧版MD5格式"""
+    return bool(LEGACY_MD5_RE.match(stored_hash or ""))
+
+
+# 近期校验通过的密码缓存，键为以SECRET_KEY为密钥对(哈希, 密码)计算的HMAC，
+# 短时间内重复登录无需再次计算PBKDF2；只缓存校验通过的结果，不保存明文密码
+password_verify_cache = TTLCache(maxsize=2048, ttl=60)
+
+
+def verify_password(stored_hash, password):
+    """校验用户输入的密码是否与数据库中的哈希匹配（兼容旧版MD5）"""
+    if is_legacy_password_hash(stored_hash):
+        legacy_hash = hashlib.md5(password.encode("utf-8")).hexdigest()
+        # 使用常量时间比较，避免通过响应时间推断哈希内容
+        return hmac.compare_digest(legacy_hash, stored_hash.lower())
+    cache_key = hmac.new(
+        SECRET_KEY_BYTES,
+        stored_hash.encode("utf-8") + b"\0" + password.encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+    if password_verify_cache.get(cache_key):
+        return True
+    if not check_password_hash(stored_hash, password):
+        return False
+    password_verify_cache.set(cache_key, True)
+    return True
+
+
 # JWT工具函数
 def generate_token(user_id, user_name, user_role):
     """生成JWT token"""
+    now = int(time.time())
     payload = {
-        "exp": datetime.now(timezone.utc) + app.config["JWT_EXPIRATION_DELTA"],
-        "iat": datetime.now(timezone.utc),
+        "exp": now + JWT_EXPIRATION_SECONDS,
+        "iat": now,
         "sub": user_id,
         "user_name": user_name,
         "user_role": user_role,
     }
-    return jwt.encode(payload, app.config["SECRET_KEY"], algorithm="HS256")
+    return jwt.encode(payload, SECRET_KEY, algorithm=JWT_ALGORITHM)
 
 
 # 验证token的装饰器
@@ -110,9 +640,23 @@ def token_required(f):
         if not token:
             return jsonify({"message": "Token缺失"}), 401
 
+        # JWT由三段组成，格式明显不对的token直接拒绝，不再计算摘要和校验签名
+        if token.count(".") != 2:
+            return jsonify({"message": "无效的Token"}), 401
+
+        # 近期验证过的token直接复用解码结果，跳过签名校验
+        cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+        cached = token_cache.get(cache_key)
+        if cached is not None:
+            current_user, exp = cached
+            if exp <= time.time():
+                token_cache.pop(cache_key)
+                return jsonify({"message": "Token已过期"}), 401
+            return f(dict(current_user), *args, **kwargs)
+
         try:
             # 解码token
-            data = jwt.decode(token, app.config["SECRET_KEY"], algorithms=["HS256"])
+            data = jwt.decode(token, SECRET_KEY, algorithms=JWT_ALGORITHMS)
             current_user = {
                 "user_id": data["sub"],
                 "user_name": data["user_name"],
@@ -123,7 +667,10 @@ def token_required(f):
         except jwt.InvalidTokenError:
             return jsonify({"message": "无效的Token"}), 401
 
-        return f(current_user, *args, **kwargs)
+        # 只缓存验证成功的token
+        token_cache.set(cache_key, (current_user, data["exp"]))
+
+        return f(dict(current_user), *args, **kwargs)
 
     return decorated
 
@@ -137,7 +684,7 @@ def health_check():
         connection.close()
         return jsonify({"status": "ok", "message": "服务正常运行"}), 200
     except Exception as e:
-        logger.error(f"健康检查失败: {str(e)}")
+        logger.error("健康检查失败: %s", e)
         return jsonify({"status": "error", "message": f"数据库连接失败: {str(e)}"}), 500
 
 
@@ -146,63 +693,69 @@ def health_check():
 def login():
     """用户登录接口"""
     try:
-        data = request.get_json()
+        # 请求体不是合法JSON对象时直接返回400，不抛出异常
+        data = request.get_json(silent=True, cache=False)
+        if not isinstance(data, dict):
+            return jsonify({"message": "请求参数格式错误"}), 400
         # 兼容两种参数名格式
         user_name = data.get("userName") or data.get("user_name")
         password = data.get("password")
 
         if not user_name or not password:
             return jsonify({"message": "用户名和密码不能为空"}), 400
+        if not isinstance(user_name, str) or not isinstance(password, str):
+            return jsonify({"message": "请求参数格式错误"}), 400
 
         # 查询数据库验证用户
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                sql = (
-                    "SELECT * FROM User WHERE user_name = %s AND user_status = 'active'"
-                )
-                cursor.execute(sql, (user_name,))
+                # 只取登录和返回用户信息所需的列
+                cursor.execute(SQL_LOGIN_SELECT, (user_name,))
                 user = cursor.fetchone()
 
                 if not user:
-                    return jsonify({"message": "用户名不存在或账户已禁用"}), 401
-
-                # 使用MD5加密用户输入的密码后与数据库中的加密密码比对
-                # 创建MD5哈希对象
-                md5 = hashlib.md5()
-                # 更新哈希对象，需要将字符串转换为字节
-                md5.update(password.encode("utf-8"))
-                # 获取加密后的密码（16进制格式）
-                hashed_password = md5.hexdigest()
-
-                if user["user_password"] != hashed_password:
-                    return jsonify({"message": "密码错误"}), 401
-
-                # 更新最后登录时间
-                update_sql = (
-                    "UPDATE User SET user_last_login_time = NOW() WHERE user_id = %s"
-                )
-                cursor.execute(update_sql, (user["user_id"],))
-                connection.commit()
+                    # 用户不存在时同样计算一次哈希，避免通过响应时间判断用户名是否存在
+                    check_password_hash(DUMMY_PASSWORD_HASH, password)
+                    return jsonify({"message": "用户名或密码错误"}), 401
+
+                (
+                    user_id,
+                    db_user_name,
+                    password_hash,
+                    user_role,
+                    user_status,
+                    user_email,
+                    user_phone,
+                    user_create_time,
+                ) = LOGIN_USER_FIELDS(user)
+
+                # 校验密码（兼容旧版MD5哈希）
+                if not verify_password(password_hash, password):
+                    return jsonify({"message": "用户名或密码错误"}), 401
+
+                if is_legacy_password_hash(password_hash):
+                    # 旧版MD5密码校验通过后升级为加盐哈希
+                    cursor.execute(
+                        SQL_UPGRADE_PASSWORD, (hash_password(password), user_id)
+                    )
+                    connection.commit()
+
+                # 最后登录时间交给后台线程批量写入
+                last_login_writer.record(user_id)
 
                 # 生成token
-                token = generate_token(
-                    user["user_id"], user["user_name"], user["user_role"]
-                )
+                token = generate_token(user_id, db_user_name, user_role)
 
                 # 构建用户信息
                 user_info = {
-                    "user_id": user["user_id"],
-                    "user_name": user["user_name"],
-                    "user_role": user["user_role"],
-                    "user_status": user["user_status"],
-                    "user_email": user.get("user_email"),
-                    "user_phone": user.get("user_phone"),
-                    "user_create_time": (
-                        user["user_create_time"].isoformat()
-                        if user.get("user_create_time")
-                        else None
-                    ),
+                    "user_id": user_id,
+                    "user_name": db_user_name,
+                    "user_role": user_role,
+                    "user_status": user_status,
+                    "user_email": user_email,
+                    "user_phone": user_phone,
+                    "user_create_time": user_create_time,
                     "user_last_login_time": datetime.now().isoformat(),  # 当前登录时间
                 }
 
@@ -216,7 +769,7 @@ def login():
         finally:
             connection.close()
     except Exception as e:
-        logger.error(f"登录过程中发生错误: {str(e)}")
+        logger.error("登录过程中发生错误: %s", e)
         return jsonify({"message": f"登录失败: {str(e)}"}), 500
 
 
@@ -225,7 +778,10 @@ def login():
 def register():
     """用户注册接口"""
     try:
-        data = request.get_json()
+        # 请求体不是合法JSON对象时直接返回400，不抛出异常
+        data = request.get_json(silent=True, cache=False)
+        if not isinstance(data, dict):
+            return jsonify({"message": "请求参数格式错误"}), 400
         # 兼容两种参数名格式
         user_name = data.get("userName") or data.get("user_name")
         password = data.get("password")
@@ -235,50 +791,42 @@ def register():
         # 验证必填字段
         if not user_name or not password or not email:
             return jsonify({"message": "用户名、密码和邮箱为必填项"}), 400
+        if not all(isinstance(value, str) for value in (user_name, password, email)):
+            return jsonify({"message": "请求参数格式错误"}), 400
 
         # 验证用户名格式（仅允许英文、数字、下划线）
-        if not re.match(r"^[a-zA-Z0-9_]+$", user_name):
+        if not USERNAME_RE.match(user_name):
             return jsonify({"message": "用户名仅允许英文、数字、下划线"}), 400
 
         # 连接数据库
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 检查用户名是否已存在
-                check_sql = "SELECT * FROM User WHERE user_name = %s"
-                cursor.execute(check_sql, (user_name,))
-                if cursor.fetchone():
-                    return jsonify({"message": "用户名已存在"}), 400
-
-                # 检查邮箱是否已存在
-                check_email_sql = "SELECT * FROM User WHERE user_email = %s"
-                cursor.execute(check_email_sql, (email,))
-                if cursor.fetchone():
-                    return jsonify({"message": "该邮箱已被注册"}), 400
+                # 生成用户ID，去掉连字符的32位十六进制串，主键更短且可直接放入JWT
+                user_id = uuid7().hex
 
-                # 生成用户ID
-                user_id = str(uuid.uuid4())
+                # 使用加盐哈希加密密码
+                hashed_password = hash_password(password)
 
-                # 使用MD5加密密码
-                md5 = hashlib.md5()
-                md5.update(password.encode("utf-8"))
-                hashed_password = md5.hexdigest()
-
-                # 插入用户数据
-                insert_sql = """
-                INSERT INTO User (user_id, user_name, user_password, user_role, user_status, user_email, user_phone)
-                VALUES (%s, %s, %s, 'analyst', 'active', %s, %s)
-                """
-                cursor.execute(
-                    insert_sql, (user_id, user_name, hashed_password, email, phone)
-                )
+                # 插入用户数据，用户名和邮箱是否重复由唯一索引判断，无需事先查询
+                try:
+                    cursor.execute(
+                        SQL_INSERT_USER,
+                        (user_id, user_name, hashed_password, email, phone),
+                    )
+                except mysql_driver.IntegrityError as e:
+                    if e.args[0] == ER.DUP_ENTRY and "uk_user_name" in str(e):
+                        return jsonify({"message": "用户名已存在"}), 400
+                    if e.args[0] == ER.DUP_ENTRY and "uk_user_email" in str(e):
+                        return jsonify({"message": "该邮箱已被注册"}), 400
+                    raise
                 connection.commit()
 
                 return jsonify({"message": "注册成功，请登录"}), 201
         finally:
             connection.close()
     except Exception as e:
-        logger.error(f"注册过程中发生错误: {str(e)}")
+        logger.error("注册过程中发生错误: %s", e)
         return jsonify({"message": f"注册失败: {str(e)}"}), 500
 
 
@@ -288,35 +836,27 @@ def register():
 def get_user_info(current_user):
     """获取当前用户信息接口"""
     try:
+        user_data = user_info_cache.get(current_user["user_id"])
+        if user_data is not None:
+            return (
+                jsonify(
+                    {"code": 200, "data": user_data, "message": "获取用户信息成功"}
+                ),
+                200,
+            )
+
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                sql = "SELECT user_id, user_name, user_role, user_status, user_email, user_phone, user_create_time, user_last_login_time FROM User WHERE user_id = %s"
-                cursor.execute(sql, (current_user["user_id"],))
+                cursor.execute(SQL_GET_USER_INFO, (current_user["user_id"],))
                 user = cursor.fetchone()
 
                 if not user:
                     return jsonify({"code": 404, "message": "用户不存在"}), 404
 
-                # 格式化日期字段
-                user_data = {
-                    "user_id": user["user_id"],
-                    "user_name": user["user_name"],
-                    "user_role": user["user_role"],
-                    "user_status": user.get("user_status"),
-                    "user_email": user.get("user_email"),
-                    "user_phone": user.get("user_phone"),
-                    "user_create_time": (
-                        user["user_create_time"].isoformat()
-                        if user.get("user_create_time")
-                        else None
-                    ),
-                    "user_last_login_time": (
-                        user["user_last_login_time"].isoformat()
-                        if user.get("user_last_login_time")
-                        else None
-                    ),
-                }
+                # 查询列即返回字段（时间已在SQL中格式化），行字典直接返回
+                user_data = user
+                user_info_cache.set(user_data["user_id"], user_data)
 
                 return (
                     jsonify(
@@ -327,7 +867,7 @@ def get_user_info(current_user):
         finally:
             connection.close()
     except Exception as e:
-        logger.error(f"获取用户信息过程中发生错误: {str(e)}")
+        logger.error("获取用户信息过程中发生错误: %s", e)
         return jsonify({"message": f"获取用户信息失败: {str(e)}"}), 500
 
 
@@ -336,6 +876,65 @@ def get_user_info(current_user):
 # =============================================
 
 
+@lru_cache(maxsize=None)
+def build_param_list_sql(
+    type_filter, by_source_type, has_search, include_total, keyset
+):
+    """按筛选条件组合生成参数列表的(数据SQL, 计数SQL)
+
+    同一组合总是得到同一条SQL文本，只需拼接一次，数据库端也能复用解析结果。
+    占位符顺序：创建者、参数类型、两个搜索词，然后是分页参数。
+    """
+    where_conditions = []
+    if type_filter == "my":
+        where_conditions.append("creator_name = %s")
+    elif type_filter == "system":
+        where_conditions.append("creator_name = 'system'")
+    if by_source_type:
+        where_conditions.append("param_type = %s")
+    if has_search:
+        where_conditions.append("(param_name LIKE %s OR data_id LIKE %s)")
+    where_sql = " AND ".join(where_conditions) or "1=1"
+
+    # 需要总数时用窗口函数随数据一起返回，省去单独的COUNT查询
+    # 游标分页时窗口函数只能数到游标之后的行，总数改为单独统计
+    total_column = ", COUNT(*) OVER() AS total" if include_total and not keyset else ""
+    data_sql = f"""
+    SELECT 
+        CONCAT(creator_name, '.', param_name) as id,
+        creator_name,
+        param_name,
+        data_id,
+        param_type,
+        pre_period,
+        post_period,
+        agg_func,
+        DATE_FORMAT(creation_time, '%%Y-%%m-%%d %%H:%%i:%%s') as create_time{total_column}
+    FROM Param
+    WHERE {where_sql}
+    """
+    if keyset:
+        # 游标分页：从主键索引上一页最后一行之后开始读取，不再扫描被跳过的行
+        data_sql += (
+            " AND (creator_name > %s OR (creator_name = %s AND param_name > %s))"
+        )
+        data_sql += " ORDER BY creator_name, param_name LIMIT %s"
+    else:
+        data_sql += " ORDER BY creator_name, param_name LIMIT %s OFFSET %s"
+    count_sql = f"SELECT COUNT(*) as total FROM Param WHERE {where_sql}"
+    return data_sql, count_sql
+
+
+# 参数列表查询结果缓存，键为参数表版本号加筛选和分页条件，值为(参数列表, 总数, 下一页游标)
+# 参数表有任何写入时调用param_list_version.bump()，所有工作进程的旧结果随之失效
+param_list_cache = TTLCache(maxsize=1000, ttl=30)
+param_list_version = SharedVersion(os.path.join(CACHE_VERSION_DIR, "param_list"))
+
+
+# 参数列表单页最大条数
+MAX_PAGE_SIZE = 1000
+
+
 # 获取参数列表API
 @app.route("/api/params", methods=["GET"])
 @token_required
@@ -344,122 +943,252 @@ def get_params(current_user):
     try:
         # 获取查询参数
         page = int(request.args.get("page", 1))
-        page_size = int(request.args.get("page_size", 10))
+        page_size = min(max(int(request.args.get("page_size", 10)), 1), MAX_PAGE_SIZE)
         search_keyword = request.args.get("search", "").strip()
         param_type_filter = request.args.get("param_type", "my")  # my, system, all
         param_source_type = request.args.get(
             "param_source_type", "all"
         )  # all, table, indicator
+        # 不需要总数的客户端可传入include_total=0跳过计数
+        include_total = request.args.get("include_total", "1") in ("1", "true")
+        # 传入cursor时按(creator_name, param_name)游标分页，否则沿用page分页
+        page_cursor = request.args.get("cursor")
+        after_key = None
+        if page_cursor:
+            try:
+                after_key = decode_page_cursor(page_cursor, 2)
+            except ValueError as e:
+                return jsonify({"message": str(e)}), 400
+
+        if param_type_filter not in ("my", "system"):
+            param_type_filter = "all"
+        cache_key = (
+            param_list_version.get(),
+            current_user["user_name"] if param_type_filter == "my" else None,
+            param_type_filter,
+            param_source_type,
+            search_keyword,
+            include_total,
+            page,
+            page_size,
+            page_cursor,
+        )
+        # 相同条件的查询在缓存有效期内直接复用结果
+        cached = param_list_cache.get(cache_key)
+        if cached is not None:
+            formatted_params, total, next_cursor = cached
+        else:
+            connection = get_db_connection()
+            try:
+                with connection.cursor() as cursor:
+                    # 用户名直接取自token，无需再查询User表
+                    current_user_name = current_user["user_name"]
+
+                    # 筛选值只决定SQL结构，按组合取预先拼好的SQL文本
+                    data_sql, count_sql = build_param_list_sql(
+                        param_type_filter,
+                        param_source_type != "all",
+                        bool(search_keyword),
+                        include_total,
+                        after_key is not None,
+                    )
 
-        connection = get_db_connection()
-        try:
-            with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
+                    query_params = []
+                    if param_type_filter == "my":
+                        query_params.append(current_user_name)
+                    if param_source_type != "all":
+                        query_params.append(param_source_type)
+                    if search_keyword:
+                        query_params.extend(
+                            [f"%{search_keyword}%", f"%{search_keyword}%"]
+                        )
+                    count_params = list(query_params)
 
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
+                    # 分页参数
+                    if after_key is not None:
+                        query_params.extend(
+                            [after_key[0], after_key[0], after_key[1], page_size]
+                        )
+                    else:
+                        query_params.extend([page_size, (page - 1) * page_size])
+
+                    total = None
+                    cursor.execute(data_sql, query_params)
+                    # 查询列已是返回格式（id拼接、时间格式化均在SQL中完成），行字典直接返回
+                    formatted_params = cursor.fetchall()
+                    if include_total and after_key is None and formatted_params:
+                        total = formatted_params[0]["total"]
+                        for param in formatted_params:
+                            del param["total"]
+
+                    if include_total and total is None:
+                        if after_key is None and page == 1:
+                            total = 0
+                        else:
+                            # 游标分页或页码超出范围时窗口函数拿不到总数，单独统计一次
+                            cursor.execute(count_sql, count_params)
+                            total_result = cursor.fetchone()
+                            total = total_result["total"] if total_result else 0
+
+                    # 本页已满时返回下一页游标
+                    next_cursor = None
+                    if len(formatted_params) == page_size:
+                        last = formatted_params[-1]
+                        next_cursor = encode_page_cursor(
+                            (last["creator_name"], last["param_name"])
+                        )
 
-                current_user_name = current_user_info["user_name"]
+                    param_list_cache.set(
+                        cache_key, (formatted_params, total, next_cursor)
+                    )
+            finally:
+                connection.close()
 
-                # 构建基础查询SQL
-                base_sql = """
-                SELECT 
-                    CONCAT(creator_name, '.', param_name) as id,
-                    creator_name,
-                    param_name,
-                    data_id,
-                    param_type,
-                    pre_period,
-                    post_period,
-                    agg_func,
-                    DATE_FORMAT(creation_time, '%%Y-%%m-%%d %%H:%%i:%%s') as create_time
-                FROM Param
-                WHERE 1=1
-                """
+        return (
+            jsonify(
+                {
+                    "data": {
+                        "params": formatted_params,
+                        "total": total,
+                        "page": page,
+                        "page_size": page_size,
+                        "next_cursor": next_cursor,
+                    },
+                    "message": "获取参数列表成功",
+                }
+            ),
+            200,
+        )
 
-                # 构建WHERE条件
-                where_conditions = []
-                query_params = []
+    except Exception as e:
+        logger.error("获取参数列表过程中发生错误: %s", e)
+        return jsonify({"message": f"获取参数列表失败: {str(e)}"}), 500
 
-                # 根据参数类型筛选
-                if param_type_filter == "my":
-                    where_conditions.append("creator_name = %s")
-                    query_params.append(current_user_name)
-                elif param_type_filter == "system":
-                    where_conditions.append("creator_name = 'system'")
 
-                # 根据参数来源类型筛选
-                if param_source_type != "all":
-                    where_conditions.append("param_type = %s")
-                    query_params.append(param_source_type)
+# 创建/更新参数时的必填字段
+PARAM_REQUIRED_FIELDS = (
+    "param_name",
+    "data_id",
+    "param_type",
+    "pre_period",
+    "post_period",
+)
 
-                # 根据搜索关键词筛选
-                if search_keyword:
-                    where_conditions.append("(param_name LIKE %s OR data_id LIKE %s)")
-                    query_params.extend([f"%{search_keyword}%", f"%{search_keyword}%"])
-
-                # 组装完整的查询SQL
-                if where_conditions:
-                    count_sql = f"SELECT COUNT(*) as total FROM Param WHERE {' AND '.join(where_conditions)}"
-                    data_sql = f"{base_sql} AND {' AND '.join(where_conditions)} ORDER BY creator_name, param_name"
-                else:
-                    count_sql = "SELECT COUNT(*) as total FROM Param"
-                    data_sql = f"{base_sql} ORDER BY creator_name, param_name"
-
-                # 获取总数
-                cursor.execute(count_sql, query_params)
-                total_result = cursor.fetchone()
-                total = total_result["total"] if total_result else 0
-
-                # 分页查询数据
-                offset = (page - 1) * page_size
-                data_sql += f" LIMIT %s OFFSET %s"
-                query_params.extend([page_size, offset])
-
-                cursor.execute(data_sql, query_params)
-                params = cursor.fetchall()
-
-                # 格式化返回数据
-                formatted_params = []
-                for param in params:
-                    formatted_params.append(
-                        {
-                            "id": param["id"],
-                            "creator_name": param["creator_name"],
-                            "param_name": param["param_name"],
-                            "data_id": param["data_id"],
-                            "param_type": param["param_type"],
-                            "pre_period": param["pre_period"],
-                            "post_period": param["post_period"],
-                            "agg_func": param["agg_func"],
-                            "create_time": param["create_time"],
-                        }
-                    )
 
-                return (
-                    jsonify(
-                        {
-                            "data": {
-                                "params": formatted_params,
-                                "total": total,
-                                "page": page,
-                                "page_size": page_size,
-                            },
-                            "message": "获取参数列表成功",
-                        }
-                    ),
-                    200,
-                )
+def parse_param_payload(data):
+    """校验创建/更新参数的请求体
 
-        finally:
-            connection.close()
+    校验通过返回(字段字典, None)，否则返回(None, 错误信息)。
+    """
+    if not isinstance(data, dict):
+        return None, "请求参数格式错误"
 
-    except Exception as e:
-        logger.error(f"获取参数列表过程中发生错误: {str(e)}")
-        return jsonify({"message": f"获取参数列表失败: {str(e)}"}), 500
+    # 验证必填字段
+    for field in PARAM_REQUIRED_FIELDS:
+        if data.get(field) is None:
+            return None, f"缺少必填字段: {field}"
+
+    param_name = str(data["param_name"]).strip()
+    data_id = str(data["data_id"]).strip()
+    param_type = data["param_type"]
+
+    # 处理agg_func字段（可选字段，可以为空）
+    agg_func = data.get("agg_func")
+    if agg_func is not None:
+        agg_func = str(agg_func).strip() or None
+
+    # 验证数据格式
+    if not param_name or not data_id:
+        return None, "参数ID和数据来源ID不能为空"
+
+    if param_type not in ("table", "indicator"):
+        return None, "参数类型必须是table或indicator"
+
+    try:
+        pre_period = int(data["pre_period"])
+        post_period = int(data["post_period"])
+    except (ValueError, TypeError):
+        return None, "历史天数和预测天数必须是整数"
+
+    if pre_period < 0 or post_period < 0:
+        return None, "历史天数和预测天数不能为负数"
+
+    # 验证参数ID格式（仅允许字母、数字、下划线和点号）
+    if not PARAM_NAME_RE.match(param_name):
+        return None, "参数ID只能包含字母、数字、下划线和点号"
+
+    return {
+        "param_name": param_name,
+        "data_id": data_id,
+        "param_type": param_type,
+        "pre_period": pre_period,
+        "post_period": post_period,
+        "agg_func": agg_func,
+    }, None
+
+
+# 参数写操作相关SQL语句（模块级常量，避免每次请求重新构造）
+# 检查参数是否已存在，同时取得数据库当前时间作为创建时间
+SQL_CHECK_NEW_PARAM = """
+SELECT DATE_FORMAT(NOW(), '%%Y-%%m-%%d %%H:%%i:%%s') AS create_time,
+       EXISTS(
+           SELECT 1 FROM Param WHERE creator_name = %s AND param_name = %s
+       ) AS param_exists
+"""
+SQL_INSERT_PARAM = """
+INSERT INTO Param (creator_name, param_name, data_id, param_type, pre_period, post_period, agg_func, creation_time)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+# 锁定原参数和新参数ID对应的行
+# 名称比较在SQL中按列的排序规则进行（不区分大小写），与主键判重规则一致
+SQL_LOCK_PARAMS_FOR_UPDATE = """
+SELECT param_name = %s AS is_current, param_name = %s AS is_new,
+       DATE_FORMAT(creation_time, '%%Y-%%m-%%d %%H:%%i:%%s') as create_time
+FROM Param WHERE creator_name = %s AND param_name IN (%s, %s)
+FOR UPDATE
+"""
+SQL_RENAME_PARAM = """
+UPDATE Param
+SET param_name = %s, data_id = %s, param_type = %s,
+    pre_period = %s, post_period = %s, agg_func = %s
+WHERE creator_name = %s AND param_name = %s
+"""
+SQL_UPDATE_PARAM = """
+UPDATE Param
+SET data_id = %s, param_type = %s, pre_period = %s, post_period = %s, agg_func = %s
+WHERE creator_name = %s AND param_name = %s
+"""
+# 仅当参数未被任何指标或策略引用时才删除
+SQL_DELETE_UNUSED_PARAM = """
+DELETE FROM Param
+WHERE creator_name = %s AND param_name = %s
+  AND NOT EXISTS (
+      SELECT 1 FROM IndicatorParamRel
+      WHERE param_creator_name = %s AND param_name = %s
+  )
+  AND NOT EXISTS (
+      SELECT 1 FROM StrategyParamRel
+      WHERE param_creator_name = %s AND param_name = %s
+  )
+"""
+# 一次查询同时取得参数是否存在以及引用它的指标和策略
+SQL_PARAM_USAGE = """
+SELECT 'param' AS kind, NULL AS name
+FROM Param WHERE creator_name = %s AND param_name = %s
+UNION ALL
+SELECT 'indicator', i.indicator_name
+FROM IndicatorParamRel ipr
+JOIN Indicator i ON ipr.indicator_creator_name = i.creator_name
+    AND ipr.indicator_name = i.indicator_name
+WHERE ipr.param_creator_name = %s AND ipr.param_name = %s
+UNION ALL
+SELECT 'strategy', s.strategy_name
+FROM StrategyParamRel spr
+JOIN Strategy s ON spr.strategy_creator_name = s.creator_name
+    AND spr.strategy_name = s.strategy_name
+WHERE spr.param_creator_name = %s AND spr.param_name = %s
+"""
+SQL_DELETE_PARAM = "DELETE FROM Param WHERE creator_name = %s AND param_name = %s"
 
 
 # 创建参数API
@@ -468,83 +1197,33 @@ def get_params(current_user):
 def create_param(current_user):
     """创建参数接口"""
     try:
-        data = request.get_json()
-
-        # 验证必填字段
-        required_fields = [
-            "param_name",
-            "data_id",
-            "param_type",
-            "pre_period",
-            "post_period",
-        ]
-        for field in required_fields:
-            if field not in data or data[field] is None:
-                return jsonify({"message": f"缺少必填字段: {field}"}), 400
-
-        param_name = (
-            str(data["param_name"]).strip() if data["param_name"] is not None else ""
-        )
-        data_id = str(data["data_id"]).strip() if data["data_id"] is not None else ""
-        param_type = data["param_type"]
-        pre_period = data["pre_period"]
-        post_period = data["post_period"]
-
-        # 处理agg_func字段（可选字段，可以为空）
-        agg_func_raw = data.get("agg_func")
-        if agg_func_raw is None or agg_func_raw == "":
-            agg_func = None
-        else:
-            agg_func = str(agg_func_raw).strip() if str(agg_func_raw).strip() else None
-
-        # 验证数据格式
-        if not param_name or not data_id:
-            return jsonify({"message": "参数ID和数据来源ID不能为空"}), 400
-
-        if param_type not in ["table", "indicator"]:
-            return jsonify({"message": "参数类型必须是table或indicator"}), 400
-
-        try:
-            pre_period = int(pre_period)
-            post_period = int(post_period)
-        except (ValueError, TypeError):
-            return jsonify({"message": "历史天数和预测天数必须是整数"}), 400
-
-        if pre_period < 0 or post_period < 0:
-            return jsonify({"message": "历史天数和预测天数不能为负数"}), 400
-
-        # 验证参数ID格式（仅允许字母、数字、下划线和点号）
-        if not re.match(r"^[a-zA-Z0-9_.]+$", param_name):
-            return jsonify({"message": "参数ID只能包含字母、数字、下划线和点号"}), 400
+        fields, error = parse_param_payload(request.get_json(silent=True))
+        if error:
+            return jsonify({"message": error}), 400
+        param_name = fields["param_name"]
+        data_id = fields["data_id"]
+        param_type = fields["param_type"]
+        pre_period = fields["pre_period"]
+        post_period = fields["post_period"]
+        agg_func = fields["agg_func"]
 
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
-
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = current_user_info["user_name"]
+                # 用户名直接取自token，无需再查询User表
+                current_user_name = current_user["user_name"]
 
-                # 检查参数ID是否已存在（同一创建者下）
-                check_sql = (
-                    "SELECT * FROM Param WHERE creator_name = %s AND param_name = %s"
-                )
-                cursor.execute(check_sql, (current_user_name, param_name))
-                if cursor.fetchone():
+                # 检查参数ID是否已存在（同一创建者下），同时取得数据库当前时间作为创建时间，
+                # 保证返回的创建时间与写入数据库的一致
+                cursor.execute(SQL_CHECK_NEW_PARAM, (current_user_name, param_name))
+                check_result = cursor.fetchone()
+                if check_result["param_exists"]:
                     return jsonify({"message": f'参数ID "{param_name}" 已存在'}), 400
+                create_time = check_result["create_time"]
 
                 # 插入新参数
-                insert_sql = """
-                INSERT INTO Param (creator_name, param_name, data_id, param_type, pre_period, post_period, agg_func)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """
                 cursor.execute(
-                    insert_sql,
+                    SQL_INSERT_PARAM,
                     (
                         current_user_name,
                         param_name,
@@ -553,9 +1232,11 @@ def create_param(current_user):
                         pre_period,
                         post_period,
                         agg_func,
+                        create_time,
                     ),
                 )
                 connection.commit()
+                param_list_version.bump()
 
                 # 返回创建的参数信息
                 new_param = {
@@ -567,7 +1248,7 @@ def create_param(current_user):
                     "pre_period": pre_period,
                     "post_period": post_period,
                     "agg_func": agg_func,
-                    "create_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "create_time": create_time,
                 }
 
                 return jsonify({"data": new_param, "message": "参数创建成功"}), 201
@@ -576,7 +1257,7 @@ def create_param(current_user):
             connection.close()
 
     except Exception as e:
-        logger.error(f"创建参数过程中发生错误: {str(e)}")
+        logger.error("创建参数过程中发生错误: %s", e)
         return jsonify({"message": f"创建参数失败: {str(e)}"}), 500
 
 
@@ -587,82 +1268,43 @@ def update_param(current_user, param_composite_id):
     """更新参数接口"""
     try:
         # 解析复合ID (格式: creator_name.param_name)
-        try:
-            parts = param_composite_id.split(".", 1)
-            if len(parts) != 2:
-                return jsonify({"message": "无效的参数ID格式"}), 400
-            creator_name, param_name = parts
-        except:
+        parts = param_composite_id.split(".", 1)
+        if len(parts) != 2:
             return jsonify({"message": "无效的参数ID格式"}), 400
-
-        data = request.get_json()
-
-        # 验证必填字段
-        required_fields = [
-            "param_name",
-            "data_id",
-            "param_type",
-            "pre_period",
-            "post_period",
-        ]
-        for field in required_fields:
-            if field not in data or data[field] is None:
-                return jsonify({"message": f"缺少必填字段: {field}"}), 400
-
-        new_param_name = (
-            str(data["param_name"]).strip() if data["param_name"] is not None else ""
-        )
-        data_id = str(data["data_id"]).strip() if data["data_id"] is not None else ""
-        param_type = data["param_type"]
-        pre_period = data["pre_period"]
-        post_period = data["post_period"]
-
-        # 处理agg_func字段（可选字段，可以为空）
-        agg_func_raw = data.get("agg_func")
-        if agg_func_raw is None or agg_func_raw == "":
-            agg_func = None
-        else:
-            agg_func = str(agg_func_raw).strip() if str(agg_func_raw).strip() else None
-
-        # 验证数据格式
-        if not new_param_name or not data_id:
-            return jsonify({"message": "参数ID和数据来源ID不能为空"}), 400
-
-        if param_type not in ["table", "indicator"]:
-            return jsonify({"message": "参数类型必须是table或indicator"}), 400
-
-        try:
-            pre_period = int(pre_period)
-            post_period = int(post_period)
-        except (ValueError, TypeError):
-            return jsonify({"message": "历史天数和预测天数必须是整数"}), 400
-
-        if pre_period < 0 or post_period < 0:
-            return jsonify({"message": "历史天数和预测天数不能为负数"}), 400
-
-        # 验证参数ID格式
-        if not re.match(r"^[a-zA-Z0-9_.]+$", new_param_name):
-            return jsonify({"message": "参数ID只能包含字母、数字、下划线和点号"}), 400
+        creator_name, param_name = parts
+
+        fields, error = parse_param_payload(request.get_json(silent=True))
+        if error:
+            return jsonify({"message": error}), 400
+        new_param_name = fields["param_name"]
+        data_id = fields["data_id"]
+        param_type = fields["param_type"]
+        pre_period = fields["pre_period"]
+        post_period = fields["post_period"]
+        agg_func = fields["agg_func"]
 
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
-
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = current_user_info["user_name"]
+                # 用户名直接取自token，无需再查询User表
+                current_user_name = current_user["user_name"]
 
-                # 检查参数是否存在
-                check_sql = (
-                    "SELECT * FROM Param WHERE creator_name = %s AND param_name = %s"
+                # 一次查询同时检查原参数是否存在和新参数ID是否已被占用，
+                # 并在本事务内锁定这两行，避免检查后被并发修改
+                cursor.execute(
+                    SQL_LOCK_PARAMS_FOR_UPDATE,
+                    (
+                        param_name,
+                        new_param_name,
+                        creator_name,
+                        param_name,
+                        new_param_name,
+                    ),
+                )
+                found_params = cursor.fetchall()
+                existing_param = next(
+                    (row for row in found_params if row["is_current"]), None
                 )
-                cursor.execute(check_sql, (creator_name, param_name))
-                existing_param = cursor.fetchone()
 
                 if not existing_param:
                     return jsonify({"message": "参数不存在"}), 404
@@ -673,9 +1315,7 @@ def update_param(current_user, param_composite_id):
 
                 # 如果参数ID有变化，检查新ID是否已存在
                 if new_param_name != param_name:
-                    check_new_id_sql = "SELECT * FROM Param WHERE creator_name = %s AND param_name = %s"
-                    cursor.execute(check_new_id_sql, (creator_name, new_param_name))
-                    if cursor.fetchone():
+                    if any(row["is_new"] for row in found_params):
                         return (
                             jsonify(
                                 {"message": f'新的参数ID "{new_param_name}" 已存在'}
@@ -685,58 +1325,35 @@ def update_param(current_user, param_composite_id):
 
                 # 更新参数
                 if new_param_name != param_name:
-                    # 如果参数ID变化了，需要先更新关联关系，然后更新参数本身
-                    # 更新指标参数关系表中的参数ID引用
-                    update_indicator_rel_sql = """
-                    UPDATE IndicatorParamRel 
-                    SET param_name = %s 
-                    WHERE param_creator_name = %s AND param_name = %s
-                    """
-                    cursor.execute(
-                        update_indicator_rel_sql,
-                        (new_param_name, creator_name, param_name),
-                    )
-
-                    # 更新策略参数关系表中的参数ID引用
-                    update_strategy_rel_sql = """
-                    UPDATE StrategyParamRel 
-                    SET param_name = %s 
-                    WHERE param_creator_name = %s AND param_name = %s
-                    """
-                    cursor.execute(
-                        update_strategy_rel_sql,
-                        (new_param_name, creator_name, param_name),
-                    )
-
-                    # 更新参数表
-                    update_sql = """
-                    UPDATE Param 
-                    SET param_name = %s, data_id = %s, param_type = %s, 
-                        pre_period = %s, post_period = %s, agg_func = %s
-                    WHERE creator_name = %s AND param_name = %s
-                    """
-                    cursor.execute(
-                        update_sql,
-                        (
-                            new_param_name,
-                            data_id,
-                            param_type,
-                            pre_period,
-                            post_period,
-                            agg_func,
-                            creator_name,
-                            param_name,
-                        ),
-                    )
+                    # 关系表外键设置了ON UPDATE CASCADE，改名时指标、策略中的引用由数据库同步更新
+                    try:
+                        cursor.execute(
+                            SQL_RENAME_PARAM,
+                            (
+                                new_param_name,
+                                data_id,
+                                param_type,
+                                pre_period,
+                                post_period,
+                                agg_func,
+                                creator_name,
+                                param_name,
+                            ),
+                        )
+                    except mysql_driver.IntegrityError as e:
+                        # 检查之后仍可能因并发插入同名参数而冲突，按已存在处理
+                        if e.args[0] == ER.DUP_ENTRY:
+                            return (
+                                jsonify(
+                                    {"message": f'新的参数ID "{new_param_name}" 已存在'}
+                                ),
+                                400,
+                            )
+                        raise
                 else:
                     # 只更新除param_name外的其他字段
-                    update_sql = """
-                    UPDATE Param 
-                    SET data_id = %s, param_type = %s, pre_period = %s, post_period = %s, agg_func = %s
-                    WHERE creator_name = %s AND param_name = %s
-                    """
                     cursor.execute(
-                        update_sql,
+                        SQL_UPDATE_PARAM,
                         (
                             data_id,
                             param_type,
@@ -749,6 +1366,7 @@ def update_param(current_user, param_composite_id):
                     )
 
                 connection.commit()
+                param_list_version.bump()
 
                 # 返回更新后的参数信息
                 updated_param = {
@@ -760,9 +1378,7 @@ def update_param(current_user, param_composite_id):
                     "pre_period": pre_period,
                     "post_period": post_period,
                     "agg_func": agg_func,
-                    "create_time": existing_param.get(
-                        "create_time", datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    ),
+                    "create_time": existing_param["create_time"],
                 }
 
                 return jsonify({"data": updated_param, "message": "参数更新成功"}), 200
@@ -771,7 +1387,7 @@ def update_param(current_user, param_composite_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"更新参数过程中发生错误: {str(e)}")
+        logger.error("更新参数过程中发生错误: %s", e)
         return jsonify({"message": f"更新参数失败: {str(e)}"}), 500
 
 
@@ -782,76 +1398,55 @@ def delete_param(current_user, param_composite_id):
     """删除参数接口"""
     try:
         # 解析复合ID (格式: creator_name.param_name)
-        try:
-            parts = param_composite_id.split(".", 1)
-            if len(parts) != 2:
-                return jsonify({"message": "无效的参数ID格式"}), 400
-            creator_name, param_name = parts
-        except:
+        parts = param_composite_id.split(".", 1)
+        if len(parts) != 2:
             return jsonify({"message": "无效的参数ID格式"}), 400
+        creator_name, param_name = parts
 
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
-
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = current_user_info["user_name"]
+                # 用户名直接取自token，无需再查询User表
+                current_user_name = current_user["user_name"]
 
-                # 检查参数是否存在
-                check_sql = (
-                    "SELECT * FROM Param WHERE creator_name = %s AND param_name = %s"
-                )
-                cursor.execute(check_sql, (creator_name, param_name))
-                existing_param = cursor.fetchone()
+                # 常见情况是删除自己未被引用的参数：用一条带条件的DELETE直接完成，
+                # 只有删除未生效时才查询具体原因
+                if creator_name == current_user_name:
+                    cursor.execute(
+                        SQL_DELETE_UNUSED_PARAM, (creator_name, param_name) * 3
+                    )
+                    if cursor.rowcount:
+                        connection.commit()
+                        param_list_version.bump()
+                        return jsonify({"message": "参数删除成功"}), 200
+
+                # 一次查询同时取得参数是否存在以及引用它的指标和策略
+                cursor.execute(SQL_PARAM_USAGE, (creator_name, param_name) * 3)
+                param_exists = False
+                indicator_relations = []
+                strategy_relations = []
+                for row in cursor.fetchall():
+                    if row["kind"] == "param":
+                        param_exists = True
+                    elif row["kind"] == "indicator":
+                        indicator_relations.append(row["name"])
+                    else:
+                        strategy_relations.append(row["name"])
 
-                if not existing_param:
+                if not param_exists:
                     return jsonify({"message": "参数不存在"}), 404
 
                 # 检查权限（只能删除自己创建的参数）
                 if creator_name != current_user_name:
                     return jsonify({"message": "无权限删除他人创建的参数"}), 403
 
-                # 检查参数是否被指标引用
-                check_indicator_rel_sql = """
-                SELECT i.indicator_name 
-                FROM IndicatorParamRel ipr
-                JOIN Indicator i ON ipr.indicator_creator_name = i.creator_name 
-                    AND ipr.indicator_name = i.indicator_name
-                WHERE ipr.param_creator_name = %s AND ipr.param_name = %s
-                """
-                cursor.execute(check_indicator_rel_sql, (creator_name, param_name))
-                indicator_relations = cursor.fetchall()
-
-                # 检查参数是否被策略引用
-                check_strategy_rel_sql = """
-                SELECT s.strategy_name 
-                FROM StrategyParamRel spr
-                JOIN Strategy s ON spr.strategy_creator_name = s.creator_name 
-                    AND spr.strategy_name = s.strategy_name
-                WHERE spr.param_creator_name = %s AND spr.param_name = %s
-                """
-                cursor.execute(check_strategy_rel_sql, (creator_name, param_name))
-                strategy_relations = cursor.fetchall()
-
                 # 如果参数被引用，返回错误信息
                 if indicator_relations or strategy_relations:
                     usage_info = []
                     if indicator_relations:
-                        indicator_names = [
-                            rel["indicator_name"] for rel in indicator_relations
-                        ]
-                        usage_info.append(f"指标: {', '.join(indicator_names)}")
+                        usage_info.append(f"指标: {', '.join(indicator_relations)}")
                     if strategy_relations:
-                        strategy_names = [
-                            rel["strategy_name"] for rel in strategy_relations
-                        ]
-                        usage_info.append(f"策略: {', '.join(strategy_names)}")
+                        usage_info.append(f"策略: {', '.join(strategy_relations)}")
 
                     return (
                         jsonify(
@@ -863,11 +1458,9 @@ def delete_param(current_user, param_composite_id):
                     )
 
                 # 删除参数（由于设置了外键约束，相关的关系记录会自动删除）
-                delete_sql = (
-                    "DELETE FROM Param WHERE creator_name = %s AND param_name = %s"
-                )
-                cursor.execute(delete_sql, (creator_name, param_name))
+                cursor.execute(SQL_DELETE_PARAM, (creator_name, param_name))
                 connection.commit()
+                param_list_version.bump()
 
                 return jsonify({"message": "参数删除成功"}), 200
 
@@ -875,7 +1468,7 @@ def delete_param(current_user, param_composite_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"删除参数过程中发生错误: {str(e)}")
+        logger.error("删除参数过程中发生错误: %s", e)
         return jsonify({"message": f"删除参数失败: {str(e)}"}), 500
 
 
@@ -909,10 +1502,45 @@ def get_suggestions(current_user):
         return jsonify({"success": True, "suggestions": suggestions})
 
     except Exception as e:
-        logger.error(f"获取智能搜索建议过程中发生错误: {str(e)}")
+        logger.error("获取智能搜索建议过程中发生错误: %s", e)
         return jsonify({"success": False, "error": str(e)})
 
 
+# 数据表建议只允许选择 daily/daily_basic，且排除 ts_code 和 trade_date 字段
+SUGGESTION_TABLES = ("daily", "daily_basic")
+SUGGESTION_EXCLUDE_FIELDS = frozenset(("ts_code", "trade_date"))
+
+# 各表的字段建议列表，元素为(小写字段名, 建议项)，表结构很少变化，缓存一小时
+table_suggestion_cache = TTLCache(maxsize=len(SUGGESTION_TABLES), ttl=60 * 60)
+
+
+def get_table_field_suggestions(table_name: str) -> list:
+    """获取指定表可供选择的字段建议，结果带缓存"""
+    suggestions = table_suggestion_cache.get(table_name)
+    if suggestions is not None:
+        return suggestions
+
+    suggestions = []
+    for field_info in get_table_fields(table_name):
+        field_name = field_info["name"]
+        if field_name in SUGGESTION_EXCLUDE_FIELDS:
+            continue
+        field_comment = field_info["comment"]
+        if field_comment:
+            item = {
+                "value": f"{table_name}.{field_name}",
+                "label": f"{field_name} - {field_comment}",
+            }
+        else:
+            item = {"value": f"{table_name}.{field_name}", "label": field_name}
+        suggestions.append((field_name.lower(), item))
+
+    # 查询失败时返回空列表，不缓存，下次请求重新查询
+    if suggestions:
+        table_suggestion_cache.set(table_name, suggestions)
+    return suggestions
+
+
 def handle_table_suggestions(input_text: str) -> list:
     """
     处理数据表类型的建议
@@ -920,64 +1548,19 @@ def handle_table_suggestions(input_text: str) -> list:
     1. 如果没有点号，搜索表名
     2. 如果有点号，点号前是表名，点号后搜索字段
     """
-    # 只允许选择 daily/daily_basic 且排除 ts_code 和 trade_date 字段
-    allowed_tables = ["daily", "daily_basic"]
-    exclude_fields = ["ts_code", "trade_date"]
     if "." not in input_text:
         # 只返回允许的表
         if not input_text:
-            return allowed_tables
-        return [
-            table for table in allowed_tables if table.startswith(input_text.lower())
-        ]
+            return list(SUGGESTION_TABLES)
+        prefix = input_text.lower()
+        return [table for table in SUGGESTION_TABLES if table.startswith(prefix)]
     else:
         table_name, field_query = input_text.split(".", 1)
-        if table_name in allowed_tables:
-            fields_info = get_table_fields(table_name)
-            # 过滤掉 ts_code 和 trade_date 字段
-            filtered_fields = [
-                f for f in fields_info if f["name"] not in exclude_fields
-            ]
-            if not field_query:
-                result = []
-                for field_info in filtered_fields:
-                    field_name = field_info["name"]
-                    field_comment = field_info["comment"]
-                    if field_comment:
-                        result.append(
-                            {
-                                "value": f"{table_name}.{field_name}",
-                                "label": f"{field_name} - {field_comment}",
-                            }
-                        )
-                    else:
-                        result.append(
-                            {"value": f"{table_name}.{field_name}", "label": field_name}
-                        )
-                return result
-            else:
-                matching_fields = []
-                for field_info in filtered_fields:
-                    field_name = field_info["name"]
-                    field_comment = field_info["comment"]
-                    if field_name.lower().startswith(field_query.lower()):
-                        if field_comment:
-                            matching_fields.append(
-                                {
-                                    "value": f"{table_name}.{field_name}",
-                                    "label": f"{field_name} - {field_comment}",
-                                }
-                            )
-                        else:
-                            matching_fields.append(
-                                {
-                                    "value": f"{table_name}.{field_name}",
-                                    "label": field_name,
-                                }
-                            )
-                return matching_fields
-        else:
+        if table_name not in SUGGESTION_TABLES:
             return []
+        suggestions = get_table_field_suggestions(table_name)
+        prefix = field_query.lower()
+        return [item for name, item in suggestions if name.startswith(prefix)]
 
 
 def handle_entity_suggestions(node_type: str, input_text: str) -> list:
@@ -1062,14 +1645,14 @@ def get_table_fields(table_name: str) -> list:
             "index_daily",
         ]:
             # 这些表在tushare_cache数据库中
-            connection = pymysql.connect(
+            connection = mysql_driver.connect(
                 host="localhost",
                 port=3306,
                 user="root",
                 password=config["db_password"],
                 database="tushare_cache",
                 charset="utf8mb4",
-                cursorclass=pymysql.cursors.DictCursor,
+                cursorclass=mysql_driver.cursors.DictCursor,
             )
             database_name = "tushare_cache"
         else:
@@ -1217,6 +1800,22 @@ def search_indicators(creator_name: str, query: str = "") -> list:
         return []
 
 
+def build_data_sources_body(suggestions: list) -> bytes:
+    """生成数据源列表接口的gzip压缩响应体"""
+    body = json_dumps({"data": suggestions[:50], "message": "获取数据源列表成功"})
+    return gzip.compress(body.encode("utf-8"))
+
+
+# 不含点号的查询只匹配固定的表名，预先为空查询和各表名的每个前缀生成压缩响应，
+# 其余不含点号的查询都没有匹配项，共用一个空列表响应
+DATA_SOURCE_PREFIX_BODIES = {
+    table[:length]: build_data_sources_body(handle_table_suggestions(table[:length]))
+    for table in SUGGESTION_TABLES
+    for length in range(len(table) + 1)
+}
+DATA_SOURCE_EMPTY_BODY = build_data_sources_body([])
+
+
 # 保留原来的数据源API作为兼容性支持
 @app.route("/api/data-sources", methods=["GET"])
 @token_required
@@ -1226,6 +1825,15 @@ def get_data_sources(current_user):
         # 获取查询参数
         query = request.args.get("q", "").strip()
 
+        # 表名查询直接返回预先压缩好的响应，客户端不支持gzip时走常规逻辑
+        if "." not in query and request.accept_encodings["gzip"] > 0:
+            body = DATA_SOURCE_PREFIX_BODIES.get(query.lower(), DATA_SOURCE_EMPTY_BODY)
+            return Response(
+                body,
+                mimetype="application/json",
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+            )
+
         # 使用新的智能搜索逻辑
         suggestions = handle_table_suggestions(query)
 
@@ -1237,7 +1845,7 @@ def get_data_sources(current_user):
         )
 
     except Exception as e:
-        logger.error(f"获取数据源列表过程中发生错误: {str(e)}")
+        logger.error("获取数据源列表过程中发生错误: %s", e)
         return jsonify({"message": f"获取数据源列表失败: {str(e)}"}), 500
 
 
@@ -1246,6 +1854,14 @@ def get_data_sources(current_user):
 # =============================================
 
 
+# 系统/公开策略列表查询结果缓存，键为策略表版本号加筛选和分页条件，值为(策略列表, 总数, 下一页游标)；
+# 另以(STRATEGY_TOTAL_KEY, 版本号)缓存策略表总行数。
+# 策略表有任何写入时调用strategy_list_version.bump()，所有工作进程的旧结果随之失效
+strategy_list_cache = TTLCache(maxsize=500, ttl=60)
+strategy_list_version = SharedVersion(os.path.join(CACHE_VERSION_DIR, "strategy_list"))
+STRATEGY_TOTAL_KEY = "total"
+
+
 # 获取策略列表API
 @app.route("/api/strategies", methods=["GET"])
 @token_required
@@ -1262,105 +1878,251 @@ def get_strategies(current_user):
         scope_type_filter = request.args.get(
             "scope_type", "all"
         )  # all, single_stock, index
+        # 无限滚动等不需要总数的客户端可传入include_total=0跳过计数查询
+        include_total = request.args.get("include_total", "1") in ("1", "true")
+        # 列表默认不返回选股函数和风控函数源码（详情接口提供），传入fields=full时返回
+        full_fields = request.args.get("fields") == "full"
+        # 传入cursor时按(update_time, creator_name, strategy_name)游标分页，
+        # 否则沿用page分页（仅适合页码较小的情况）
+        page_cursor = request.args.get("cursor")
+        after_key = None
+        if page_cursor:
+            try:
+                after_key = decode_page_cursor(page_cursor, 3)
+            except ValueError as e:
+                return jsonify({"code": 400, "message": str(e)})
+
+        # 系统策略和公开策略列表对所有用户基本相同且很少变化，无搜索词时缓存结果
+        strategy_version = strategy_list_version.get()
+        cache_key = None
+        if strategy_type_filter in ("system", "public") and not search_keyword:
+            cache_key = (
+                strategy_version,
+                strategy_type_filter,
+                # 公开策略列表排除当前用户自己的策略，需按用户区分
+                current_user["user_name"] if strategy_type_filter == "public" else None,
+                scope_type_filter,
+                include_total,
+                full_fields,
+                page,
+                page_size,
+                page_cursor,
+            )
+        cached = strategy_list_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            strategies, total, next_cursor = cached
+        else:
+            connection = get_db_connection()
+            try:
+                cursor = connection.cursor()
 
-        connection = get_db_connection()
-        try:
-            cursor = connection.cursor()
+                # 构建查询条件和参数
+                conditions = []
+                params = []
 
-            # 构建基础查询SQL
-            base_sql = """
-            SELECT s.creator_name, s.strategy_name, s.public, s.scope_type, s.scope_id,
-                   s.benchmark_index,
-                   s.select_func, s.risk_control_func, s.position_count, s.rebalance_interval,
-                   s.buy_fee_rate, s.sell_fee_rate, s.strategy_desc, 
-                   s.create_time, s.update_time
-            FROM Strategy s
-            WHERE 1=1
-            """
+                # 根据策略类型筛选
+                if strategy_type_filter == "my":
+                    conditions.append("s.creator_name = %s")
+                    params.append(current_user["user_name"])
+                elif strategy_type_filter == "system":
+                    conditions.append("s.creator_name = 'system'")
+                elif strategy_type_filter == "public":
+                    # 公开策略：只显示其他普通用户的公开策略（不包括系统策略和自己的策略）
+                    conditions.append(
+                        "s.public = TRUE AND s.creator_name != 'system' AND s.creator_name != %s"
+                    )
+                    params.append(current_user["user_name"])
 
-            # 构建查询条件和参数
-            conditions = []
-            params = []
-
-            # 根据策略类型筛选
-            if strategy_type_filter == "my":
-                conditions.append("s.creator_name = %s")
-                params.append(current_user["user_name"])
-            elif strategy_type_filter == "system":
-                conditions.append("s.creator_name = 'system'")
-            elif strategy_type_filter == "public":
-                # 公开策略：只显示其他普通用户的公开策略（不包括系统策略和自己的策略）
-                conditions.append(
-                    "s.public = TRUE AND s.creator_name != 'system' AND s.creator_name != %s"
-                )
-                params.append(current_user["user_name"])
+                # 根据搜索关键词筛选
+                if len(search_keyword) >= 2:
+                    # 走ngram全文索引，整个关键词作为短语匹配，效果等同子串搜索
+                    conditions.append(
+                        "MATCH(s.strategy_name, s.strategy_desc) AGAINST (%s IN BOOLEAN MODE)"
+                    )
+                    params.append('"' + search_keyword.replace('"', " ") + '"')
+                elif search_keyword:
+                    # 单个字符构不成ngram词元（默认长度2），仍使用LIKE
+                    conditions.append(
+                        "(s.strategy_name LIKE %s OR s.strategy_desc LIKE %s)"
+                    )
+                    keyword_pattern = f"%{search_keyword}%"
+                    params.extend([keyword_pattern, keyword_pattern])
+
+                # 根据生效范围筛选
+                if scope_type_filter != "all":
+                    conditions.append("s.scope_type = %s")
+                    params.append(scope_type_filter)
+
+                # 拼接条件
+                where_sql = " AND ".join(conditions) or "1=1"
+
+                # 总数直接按相同条件统计，不再包一层子查询物化全部匹配行；
+                # 没有任何筛选条件时统计的是全表行数，使用缓存的精确值
+                total = None
+                if include_total:
+                    if not conditions:
+                        total = strategy_list_cache.get(
+                            (STRATEGY_TOTAL_KEY, strategy_version)
+                        )
+                    if total is None:
+                        count_sql = f"SELECT COUNT(*) as total FROM Strategy s WHERE {where_sql}"
+                        cursor.execute(count_sql, params)
+                        total = cursor.fetchone()["total"]
+                        if not conditions:
+                            strategy_list_cache.set(
+                                (STRATEGY_TOTAL_KEY, strategy_version), total
+                            )
 
-            # 根据搜索关键词筛选
-            if search_keyword:
-                conditions.append(
-                    "(s.strategy_name LIKE %s OR s.strategy_desc LIKE %s)"
+                # 分页查询，按(update_time, creator_name, strategy_name)倒序保证顺序唯一
+                func_columns = (
+                    "s.select_func, s.risk_control_func," if full_fields else ""
                 )
-                keyword_pattern = f"%{search_keyword}%"
-                params.extend([keyword_pattern, keyword_pattern])
+                data_sql = f"""
+                SELECT s.creator_name, s.strategy_name, s.public, s.scope_type, s.scope_id,
+                       s.benchmark_index,
+                       {func_columns} s.position_count, s.rebalance_interval,
+                       s.buy_fee_rate, s.sell_fee_rate, s.strategy_desc,
+                       DATE_FORMAT(s.create_time, '%%Y-%%m-%%d %%H:%%i:%%s') AS create_time,
+                       DATE_FORMAT(s.update_time, '%%Y-%%m-%%d %%H:%%i:%%s') AS update_time
+                FROM Strategy s
+                WHERE {where_sql}
+                """
+                if after_key is not None:
+                    # 游标分页：从上一页最后一行之后开始读取，不再扫描被跳过的行
+                    data_sql += """
+                AND (s.update_time < %s OR (s.update_time = %s AND (
+                    s.creator_name < %s OR (s.creator_name = %s AND s.strategy_name < %s))))
+                ORDER BY s.update_time DESC, s.creator_name DESC, s.strategy_name DESC
+                LIMIT %s
+                """
+                    last_update_time, last_creator, last_name = after_key
+                    page_params = [
+                        last_update_time,
+                        last_update_time,
+                        last_creator,
+                        last_creator,
+                        last_name,
+                        page_size,
+                    ]
+                else:
+                    data_sql += """
+                ORDER BY s.update_time DESC, s.creator_name DESC, s.strategy_name DESC
+                LIMIT %s OFFSET %s
+                """
+                    page_params = [page_size, (page - 1) * page_size]
+                cursor.execute(data_sql, params + page_params)
+                # 时间字段已在SQL中格式化，行字典直接返回
+                strategies = cursor.fetchall()
+
+                # 本页已满时返回下一页游标
+                next_cursor = None
+                if len(strategies) == page_size:
+                    last = strategies[-1]
+                    next_cursor = encode_page_cursor(
+                        (
+                            last["update_time"],
+                            last["creator_name"],
+                            last["strategy_name"],
+                        )
+                    )
+
+                if cache_key is not None:
+                    strategy_list_cache.set(cache_key, (strategies, total, next_cursor))
 
-            # 根据生效范围筛选
-            if scope_type_filter != "all":
-                conditions.append("s.scope_type = %s")
-                params.append(scope_type_filter)
+            finally:
+                connection.close()
 
-            # 拼接条件
-            if conditions:
-                base_sql += " AND " + " AND ".join(conditions)
+        return jsonify(
+            {
+                "code": 200,
+                "message": "获取策略列表成功",
+                "data": {
+                    "strategies": strategies,
+                    "total": total,
+                    "page": page,
+                    "page_size": page_size,
+                    "next_cursor": next_cursor,
+                },
+            }
+        )
 
-            # 添加排序
-            base_sql += " ORDER BY s.update_time DESC"
+    except Exception as e:
+        logger.error("获取策略列表过程中发生错误: %s", e)
+        return jsonify({"code": 500, "message": "获取策略列表失败，请重试"})
 
-            # 执行查询获取总数
-            count_sql = (
-                f"SELECT COUNT(*) as total FROM ({base_sql}) as counted_strategies"
-            )
-            cursor.execute(count_sql, params)
-            total = cursor.fetchone()["total"]
 
-            # 添加分页
-            base_sql += " LIMIT %s OFFSET %s"
-            offset = (page - 1) * page_size
-            params.extend([page_size, offset])
+# 创建/更新策略时的必填字段
+STRATEGY_REQUIRED_FIELDS = ("strategy_name", "scope_type", "select_func")
 
-            # 执行分页查询
-            cursor.execute(base_sql, params)
-            strategies = cursor.fetchall()
 
-            # 格式化时间字段
-            for strategy in strategies:
-                if strategy["create_time"]:
-                    strategy["create_time"] = strategy["create_time"].strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                if strategy["update_time"]:
-                    strategy["update_time"] = strategy["update_time"].strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
+def optional_str(value):
+    """可选文本字段：去除首尾空白，未提供或为空时返回None"""
+    return str(value).strip() if value else None
 
-            return jsonify(
-                {
-                    "code": 200,
-                    "message": "获取策略列表成功",
-                    "data": {
-                        "strategies": strategies,
-                        "total": total,
-                        "page": page,
-                        "page_size": page_size,
-                    },
-                }
-            )
 
-        finally:
-            connection.close()
+def parse_strategy_payload(data):
+    """校验创建/更新策略的请求体
 
-    except Exception as e:
-        logger.error(f"获取策略列表过程中发生错误: {str(e)}")
-        return jsonify({"code": 500, "message": "获取策略列表失败，请重试"})
+    校验通过返回(字段字典, None)，否则返回(None, 错误信息)。
+    """
+    if not isinstance(data, dict):
+        return None, "请求参数格式错误"
+
+    # 验证必填字段
+    for field in STRATEGY_REQUIRED_FIELDS:
+        if not data.get(field):
+            return None, f"缺少必填字段: {field}"
+
+    strategy_name = str(data["strategy_name"]).strip()
+    scope_type = data["scope_type"]
+    scope_id = optional_str(data.get("scope_id"))
+    benchmark_index = optional_str(data.get("benchmark_index"))
+    position_count = data.get("position_count")
+    rebalance_interval = data.get("rebalance_interval")
+    try:
+        buy_fee_rate = float(data.get("buy_fee_rate", 0.001))
+        sell_fee_rate = float(data.get("sell_fee_rate", 0.001))
+    except (ValueError, TypeError):
+        return None, "手续费率必须是数字"
+
+    # 验证数据格式
+    if not strategy_name:
+        return None, "策略名称不能为空"
+
+    if scope_type not in ("all", "single_stock", "index"):
+        return None, "生效范围类型无效"
+
+    if scope_type != "all" and not scope_id:
+        return None, "当生效范围不是全部时，必须指定股票/指数ID"
+
+    if scope_type != "single_stock":
+        if not position_count or position_count <= 0:
+            return None, "持仓数量必须大于0"
+        if not rebalance_interval or rebalance_interval <= 0:
+            return None, "调仓间隔必须大于0"
+
+    # 验证策略名格式（仅允许中文、英文、数字、下划线）
+    if not STRATEGY_NAME_RE.match(strategy_name):
+        return None, "策略名称只能包含中文、英文、数字和下划线"
+
+    # 验证 benchmark_index 长度（可选）
+    if benchmark_index and len(benchmark_index) > 20:
+        return None, "基准指数代码长度不能超过20"
+
+    return {
+        "strategy_name": strategy_name,
+        "public": bool(data.get("public", True)),
+        "scope_type": scope_type,
+        "scope_id": scope_id,
+        "select_func": str(data["select_func"]).strip(),
+        "benchmark_index": benchmark_index,
+        "risk_control_func": optional_str(data.get("risk_control_func")),
+        "position_count": position_count,
+        "rebalance_interval": rebalance_interval,
+        "buy_fee_rate": buy_fee_rate,
+        "sell_fee_rate": sell_fee_rate,
+        "strategy_desc": optional_str(data.get("strategy_desc")),
+    }, None
 
 
 # 创建策略API
@@ -1369,80 +2131,27 @@ def get_strategies(current_user):
 def create_strategy(current_user):
     """创建策略接口"""
     try:
-        data = request.get_json()
-
-        # 验证必填字段
-        required_fields = ["strategy_name", "scope_type", "select_func"]
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return jsonify({"code": 400, "message": f"缺少必填字段: {field}"})
-
-        strategy_name = str(data["strategy_name"]).strip()
-        public = bool(data.get("public", True))
-        scope_type = data["scope_type"]
-        scope_id = (
-            str(data.get("scope_id", "")).strip() if data.get("scope_id") else None
-        )
-        select_func = str(data["select_func"]).strip()
-        benchmark_index = (
-            str(data.get("benchmark_index", "")).strip()
-            if data.get("benchmark_index")
-            else None
-        )
-        risk_control_func = (
-            str(data.get("risk_control_func", "")).strip()
-            if data.get("risk_control_func")
-            else None
-        )
-        position_count = data.get("position_count")
-        rebalance_interval = data.get("rebalance_interval")
-        buy_fee_rate = float(data.get("buy_fee_rate", 0.001))
-        sell_fee_rate = float(data.get("sell_fee_rate", 0.001))
-        strategy_desc = (
-            str(data.get("strategy_desc", "")).strip()
-            if data.get("strategy_desc")
-            else None
-        )
-
-        # 验证数据格式
-        if not strategy_name:
-            return jsonify({"code": 400, "message": "策略名称不能为空"})
-
-        if scope_type not in ["all", "single_stock", "index"]:
-            return jsonify({"code": 400, "message": "生效范围类型无效"})
-
-        if scope_type != "all" and not scope_id:
-            return jsonify(
-                {"code": 400, "message": "当生效范围不是全部时，必须指定股票/指数ID"}
-            )
-
-        if scope_type != "single_stock":
-            if not position_count or position_count <= 0:
-                return jsonify({"code": 400, "message": "持仓数量必须大于0"})
-            if not rebalance_interval or rebalance_interval <= 0:
-                return jsonify({"code": 400, "message": "调仓间隔必须大于0"})
-
-        # 验证 benchmark_index 长度（可选）
-        if benchmark_index and len(benchmark_index) > 20:
-            return jsonify({"code": 400, "message": "基准指数代码长度不能超过20"})
-
-        # 验证策略名格式（仅允许中文、英文、数字、下划线）
-        if not re.match(r"^[\u4e00-\u9fa5a-zA-Z0-9_]+$", strategy_name):
-            return jsonify(
-                {"code": 400, "message": "策略名称只能包含中文、英文、数字和下划线"}
-            )
+        fields, error = parse_strategy_payload(request.get_json(silent=True))
+        if error:
+            return jsonify({"code": 400, "message": error})
+        strategy_name = fields["strategy_name"]
+        public = fields["public"]
+        scope_type = fields["scope_type"]
+        scope_id = fields["scope_id"]
+        select_func = fields["select_func"]
+        benchmark_index = fields["benchmark_index"]
+        risk_control_func = fields["risk_control_func"]
+        position_count = fields["position_count"]
+        rebalance_interval = fields["rebalance_interval"]
+        buy_fee_rate = fields["buy_fee_rate"]
+        sell_fee_rate = fields["sell_fee_rate"]
+        strategy_desc = fields["strategy_desc"]
 
         connection = get_db_connection()
         try:
             cursor = connection.cursor()
 
-            # 检查策略名是否已存在（同一创建者）
-            check_sql = "SELECT COUNT(*) as count FROM Strategy WHERE creator_name = %s AND strategy_name = %s"
-            cursor.execute(check_sql, (current_user["user_name"], strategy_name))
-            if cursor.fetchone()["count"] > 0:
-                return jsonify({"code": 400, "message": "策略名称已存在"})
-
-            # 插入策略记录
+            # 插入策略记录，策略名是否已存在（同一创建者）由主键约束判断
             insert_sql = """
             INSERT INTO Strategy 
             (creator_name, strategy_name, public, scope_type, scope_id, benchmark_index, select_func, 
@@ -1451,26 +2160,32 @@ def create_strategy(current_user):
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
             """
 
-            cursor.execute(
-                insert_sql,
-                (
-                    current_user["user_name"],
-                    strategy_name,
-                    public,
-                    scope_type,
-                    scope_id,
-                    benchmark_index,
-                    select_func,
-                    risk_control_func,
-                    position_count,
-                    rebalance_interval,
-                    buy_fee_rate,
-                    sell_fee_rate,
-                    strategy_desc,
-                ),
-            )
+            try:
+                cursor.execute(
+                    insert_sql,
+                    (
+                        current_user["user_name"],
+                        strategy_name,
+                        public,
+                        scope_type,
+                        scope_id,
+                        benchmark_index,
+                        select_func,
+                        risk_control_func,
+                        position_count,
+                        rebalance_interval,
+                        buy_fee_rate,
+                        sell_fee_rate,
+                        strategy_desc,
+                    ),
+                )
+            except mysql_driver.IntegrityError as e:
+                if e.args[0] == ER.DUP_ENTRY:
+                    return jsonify({"code": 400, "message": "策略名称已存在"})
+                raise
 
             connection.commit()
+            strategy_list_version.bump()
 
             return jsonify(
                 {
@@ -1487,10 +2202,22 @@ def create_strategy(current_user):
             connection.close()
 
     except Exception as e:
-        logger.error(f"创建策略过程中发生错误: {str(e)}")
+        logger.error("创建策略过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": "创建策略失败，请重试"})
 
 
+SQL_GET_STRATEGY_DETAIL = """
+SELECT s.creator_name, s.strategy_name, s.public, s.scope_type, s.scope_id,
+       s.benchmark_index,
+       s.select_func, s.risk_control_func, s.position_count, s.rebalance_interval,
+       s.buy_fee_rate, s.sell_fee_rate, s.strategy_desc,
+       DATE_FORMAT(s.create_time, '%%Y-%%m-%%d %%H:%%i:%%s') AS create_time,
+       DATE_FORMAT(s.update_time, '%%Y-%%m-%%d %%H:%%i:%%s') AS update_time
+FROM Strategy s
+WHERE s.creator_name = %s AND s.strategy_name = %s
+"""
+
+
 # 获取策略详情API
 @app.route("/api/strategies/<creator_name>/<strategy_name>", methods=["GET"])
 @token_required
@@ -1502,17 +2229,7 @@ def get_strategy_detail(current_user, creator_name, strategy_name):
             cursor = connection.cursor()
 
             # 查询策略详情
-            select_sql = """
-            SELECT s.creator_name, s.strategy_name, s.public, s.scope_type, s.scope_id,
-                   s.benchmark_index,
-                   s.select_func, s.risk_control_func, s.position_count, s.rebalance_interval,
-                   s.buy_fee_rate, s.sell_fee_rate, s.strategy_desc, 
-                   s.create_time, s.update_time
-            FROM Strategy s
-            WHERE s.creator_name = %s AND s.strategy_name = %s
-            """
-
-            cursor.execute(select_sql, (creator_name, strategy_name))
+            cursor.execute(SQL_GET_STRATEGY_DETAIL, (creator_name, strategy_name))
             strategy = cursor.fetchone()
 
             if not strategy:
@@ -1525,16 +2242,6 @@ def get_strategy_detail(current_user, creator_name, strategy_name):
             ):
                 return jsonify({"code": 403, "message": "无权限访问此策略"})
 
-            # 格式化时间字段
-            if strategy["create_time"]:
-                strategy["create_time"] = strategy["create_time"].strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
-            if strategy["update_time"]:
-                strategy["update_time"] = strategy["update_time"].strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
-
             return jsonify(
                 {"code": 200, "message": "获取策略详情成功", "data": strategy}
             )
@@ -1543,7 +2250,7 @@ def get_strategy_detail(current_user, creator_name, strategy_name):
             connection.close()
 
     except Exception as e:
-        logger.error(f"获取策略详情过程中发生错误: {str(e)}")
+        logger.error("获取策略详情过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": "获取策略详情失败，请重试"})
 
 
@@ -1557,87 +2264,29 @@ def update_strategy(current_user, creator_name, strategy_name):
         if creator_name != current_user["user_name"]:
             return jsonify({"code": 403, "message": "无权限修改此策略"})
 
-        data = request.get_json()
-
-        # 验证必填字段
-        required_fields = ["strategy_name", "scope_type", "select_func"]
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return jsonify({"code": 400, "message": f"缺少必填字段: {field}"})
-
-        new_strategy_name = str(data["strategy_name"]).strip()
-        public = bool(data.get("public", True))
-        scope_type = data["scope_type"]
-        scope_id = (
-            str(data.get("scope_id", "")).strip() if data.get("scope_id") else None
-        )
-        select_func = str(data["select_func"]).strip()
-        benchmark_index = (
-            str(data.get("benchmark_index", "")).strip()
-            if data.get("benchmark_index")
-            else None
-        )
-        risk_control_func = (
-            str(data.get("risk_control_func", "")).strip()
-            if data.get("risk_control_func")
-            else None
-        )
-        position_count = data.get("position_count")
-        rebalance_interval = data.get("rebalance_interval")
-        buy_fee_rate = float(data.get("buy_fee_rate", 0.001))
-        sell_fee_rate = float(data.get("sell_fee_rate", 0.001))
-        strategy_desc = (
-            str(data.get("strategy_desc", "")).strip()
-            if data.get("strategy_desc")
-            else None
-        )
-
-        # 验证数据格式
-        if not new_strategy_name:
-            return jsonify({"code": 400, "message": "策略名称不能为空"})
-
-        if scope_type not in ["all", "single_stock", "index"]:
-            return jsonify({"code": 400, "message": "生效范围类型无效"})
-
-        if scope_type != "all" and not scope_id:
-            return jsonify(
-                {"code": 400, "message": "当生效范围不是全部时，必须指定股票/指数ID"}
-            )
-
-        if scope_type != "single_stock":
-            if not position_count or position_count <= 0:
-                return jsonify({"code": 400, "message": "持仓数量必须大于0"})
-            if not rebalance_interval or rebalance_interval <= 0:
-                return jsonify({"code": 400, "message": "调仓间隔必须大于0"})
-
-        # 验证策略名格式
-        if not re.match(r"^[\u4e00-\u9fa5a-zA-Z0-9_]+$", new_strategy_name):
-            return jsonify(
-                {"code": 400, "message": "策略名称只能包含中文、英文、数字和下划线"}
-            )
-
-        # 验证 benchmark_index 长度（可选）
-        if benchmark_index and len(benchmark_index) > 20:
-            return jsonify({"code": 400, "message": "基准指数代码长度不能超过20"})
+        fields, error = parse_strategy_payload(request.get_json(silent=True))
+        if error:
+            return jsonify({"code": 400, "message": error})
+        new_strategy_name = fields["strategy_name"]
+        public = fields["public"]
+        scope_type = fields["scope_type"]
+        scope_id = fields["scope_id"]
+        select_func = fields["select_func"]
+        benchmark_index = fields["benchmark_index"]
+        risk_control_func = fields["risk_control_func"]
+        position_count = fields["position_count"]
+        rebalance_interval = fields["rebalance_interval"]
+        buy_fee_rate = fields["buy_fee_rate"]
+        sell_fee_rate = fields["sell_fee_rate"]
+        strategy_desc = fields["strategy_desc"]
 
         connection = get_db_connection()
         try:
             cursor = connection.cursor()
 
-            # 检查策略是否存在
-            check_sql = "SELECT COUNT(*) as count FROM Strategy WHERE creator_name = %s AND strategy_name = %s"
-            cursor.execute(check_sql, (creator_name, strategy_name))
-            if cursor.fetchone()["count"] == 0:
-                return jsonify({"code": 404, "message": "策略不存在"})
-
-            # 如果策略名发生变化，检查新名称是否已存在
-            if new_strategy_name != strategy_name:
-                check_new_name_sql = "SELECT COUNT(*) as count FROM Strategy WHERE creator_name = %s AND strategy_name = %s"
-                cursor.execute(check_new_name_sql, (creator_name, new_strategy_name))
-                if cursor.fetchone()["count"] > 0:
-                    return jsonify({"code": 400, "message": "新策略名称已存在"})
-
-            # 更新策略记录
+            # 更新策略记录；策略参数关系、交易信号、回测报告的外键设置了ON UPDATE CASCADE，
+            # 改名时由数据库在同一语句内同步更新。策略是否存在由rowcount判断，
+            # 新策略名是否已被占用由主键约束判断
             update_sql = """
             UPDATE Strategy 
             SET strategy_name = %s, public = %s, scope_type = %s, scope_id = %s, 
@@ -1648,61 +2297,35 @@ def update_strategy(current_user, creator_name, strategy_name):
             WHERE creator_name = %s AND strategy_name = %s
             """
 
-            cursor.execute(
-                update_sql,
-                (
-                    new_strategy_name,
-                    public,
-                    scope_type,
-                    scope_id,
-                    benchmark_index,
-                    select_func,
-                    risk_control_func,
-                    position_count,
-                    rebalance_interval,
-                    buy_fee_rate,
-                    sell_fee_rate,
-                    strategy_desc,
-                    creator_name,
-                    strategy_name,
-                ),
-            )
-
-            # 如果策略名发生变化，需要更新相关的关联表
-            if new_strategy_name != strategy_name:
-                # 更新策略参数关系表
-                update_strategy_rel_sql = """
-                UPDATE StrategyParamRel 
-                SET strategy_name = %s 
-                WHERE strategy_creator_name = %s AND strategy_name = %s
-                """
-                cursor.execute(
-                    update_strategy_rel_sql,
-                    (new_strategy_name, creator_name, strategy_name),
-                )
-
-                # 更新交易信号表
-                update_signal_sql = """
-                UPDATE TradingSignal 
-                SET strategy_name = %s 
-                WHERE creator_name = %s AND strategy_name = %s
-                """
-                cursor.execute(
-                    update_signal_sql, (new_strategy_name, creator_name, strategy_name)
-                )
-
-                # 更新回测报告表
-                update_backtest_sql = """
-                UPDATE BacktestReport 
-                SET strategy_name = %s 
-                WHERE creator_name = %s AND strategy_name = %s
-                """
+            try:
                 cursor.execute(
-                    update_backtest_sql,
-                    (new_strategy_name, creator_name, strategy_name),
+                    update_sql,
+                    (
+                        new_strategy_name,
+                        public,
+                        scope_type,
+                        scope_id,
+                        benchmark_index,
+                        select_func,
+                        risk_control_func,
+                        position_count,
+                        rebalance_interval,
+                        buy_fee_rate,
+                        sell_fee_rate,
+                        strategy_desc,
+                        creator_name,
+                        strategy_name,
+                    ),
                 )
+            except mysql_driver.IntegrityError as e:
+                if e.args[0] == ER.DUP_ENTRY:
+                    return jsonify({"code": 400, "message": "新策略名称已存在"})
+                raise
+            if cursor.rowcount == 0:
+                return jsonify({"code": 404, "message": "策略不存在"})
 
             connection.commit()
+            strategy_list_version.bump()
 
             return jsonify(
                 {
@@ -1720,10 +2343,28 @@ def update_strategy(current_user, creator_name, strategy_name):
             connection.close()
 
     except Exception as e:
-        logger.error(f"更新策略过程中发生错误: {str(e)}")
+        logger.error("更新策略过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": "更新策略失败，请重试"})
 
 
+# 仅当策略没有回测报告时才删除
+SQL_DELETE_STRATEGY_WITHOUT_REPORT = """
+DELETE FROM Strategy
+WHERE creator_name = %s AND strategy_name = %s
+  AND NOT EXISTS (
+      SELECT 1 FROM BacktestReport
+      WHERE creator_name = %s AND strategy_name = %s
+  )
+"""
+SQL_STRATEGY_DELETE_CHECK = """
+SELECT
+    (SELECT COUNT(*) FROM Strategy
+     WHERE creator_name = %s AND strategy_name = %s) AS strategy_count,
+    (SELECT COUNT(*) FROM BacktestReport
+     WHERE creator_name = %s AND strategy_name = %s) AS backtest_count
+"""
+
+
 # 删除策略API
 @app.route("/api/strategies/<creator_name>/<strategy_name>", methods=["DELETE"])
 @token_required
@@ -1738,53 +2379,34 @@ def delete_strategy(current_user, creator_name, strategy_name):
         try:
             cursor = connection.cursor()
 
-            # 检查策略是否存在
-            check_sql = "SELECT COUNT(*) as count FROM Strategy WHERE creator_name = %s AND strategy_name = %s"
-            cursor.execute(check_sql, (creator_name, strategy_name))
-            if cursor.fetchone()["count"] == 0:
-                return jsonify({"code": 404, "message": "策略不存在"})
-
-            # 检查是否有关联的回测报告
-            check_backtest_sql = "SELECT COUNT(*) as count FROM BacktestReport WHERE creator_name = %s AND strategy_name = %s"
-            cursor.execute(check_backtest_sql, (creator_name, strategy_name))
-            backtest_count = cursor.fetchone()["count"]
-
-            if backtest_count > 0:
-                return jsonify(
-                    {
-                        "code": 400,
-                        "message": f"策略已有 {backtest_count} 个回测报告，不能删除",
-                    }
-                )
-
-            # 删除相关记录（先删除外键约束的表）
-            # 1. 删除策略参数关系
+            # 常见情况是删除没有回测报告的策略：用一条带条件的DELETE直接完成，
+            # 策略参数关系和交易信号由外键ON DELETE CASCADE一并删除
             cursor.execute(
-                "DELETE FROM StrategyParamRel WHERE strategy_creator_name = %s AND strategy_name = %s",
-                (creator_name, strategy_name),
+                SQL_DELETE_STRATEGY_WITHOUT_REPORT, (creator_name, strategy_name) * 2
             )
+            if cursor.rowcount:
+                connection.commit()
+                strategy_list_version.bump()
+                return jsonify({"code": 200, "message": "策略删除成功"})
 
-            # 2. 删除交易信号
-            cursor.execute(
-                "DELETE FROM TradingSignal WHERE creator_name = %s AND strategy_name = %s",
-                (creator_name, strategy_name),
-            )
+            # 删除未生效时，一次查询取得策略是否存在和回测报告数量以确定原因
+            cursor.execute(SQL_STRATEGY_DELETE_CHECK, (creator_name, strategy_name) * 2)
+            check_result = cursor.fetchone()
+            if not check_result["strategy_count"]:
+                return jsonify({"code": 404, "message": "策略不存在"})
 
-            # 3. 删除策略主记录
-            cursor.execute(
-                "DELETE FROM Strategy WHERE creator_name = %s AND strategy_name = %s",
-                (creator_name, strategy_name),
+            return jsonify(
+                {
+                    "code": 400,
+                    "message": f"策略已有 {check_result['backtest_count']} 个回测报告，不能删除",
+                }
             )
 
-            connection.commit()
-
-            return jsonify({"code": 200, "message": "策略删除成功"})
-
         finally:
             connection.close()
 
     except Exception as e:
-        logger.error(f"删除策略过程中发生错误: {str(e)}")
+        logger.error("删除策略过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": "删除策略失败，请重试"})
 
 
@@ -1802,7 +2424,7 @@ def copy_strategy(current_user, creator_name, strategy_name):
             return jsonify({"code": 400, "message": "新策略名称不能为空"})
 
         # 验证策略名格式（仅允许中文、英文、数字、下划线）
-        if not re.match(r"^[\u4e00-\u9fa5a-zA-Z0-9_]+$", new_strategy_name):
+        if not STRATEGY_NAME_RE.match(new_strategy_name):
             return jsonify(
                 {"code": 400, "message": "策略名称只能包含中文、英文、数字和下划线"}
             )
@@ -2133,6 +2755,9 @@ def copy_strategy(current_user, creator_name, strategy_name):
                     )
 
                 connection.commit()
+                strategy_list_version.bump()
+                param_list_version.bump()
+                indicator_list_version.bump()
 
                 return jsonify(
                     {
@@ -2151,7 +2776,7 @@ def copy_strategy(current_user, creator_name, strategy_name):
             connection.close()
 
     except Exception as e:
-        logger.error(f"复制策略过程中发生错误: {str(e)}")
+        logger.error("复制策略过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": f"复制策略失败: {str(e)}"})
 
 
@@ -2186,8 +2811,9 @@ def get_strategy_params(current_user, creator_name, strategy_name):
             # 查询策略关联的参数
             select_sql = """
             SELECT p.creator_name, p.param_name, p.data_id, p.param_type, 
-                   p.pre_period, p.post_period, p.agg_func, 
-                   p.creation_time, p.update_time
+                   p.pre_period, p.post_period, p.agg_func,
+                   DATE_FORMAT(p.creation_time, '%%Y-%%m-%%d %%H:%%i:%%s') AS creation_time,
+                   DATE_FORMAT(p.update_time, '%%Y-%%m-%%d %%H:%%i:%%s') AS update_time
             FROM StrategyParamRel spr
             JOIN Param p ON spr.param_creator_name = p.creator_name 
                          AND spr.param_name = p.param_name
@@ -2195,30 +2821,27 @@ def get_strategy_params(current_user, creator_name, strategy_name):
             ORDER BY p.creation_time ASC
             """
 
+            # 时间字段已在SQL中格式化，行字典直接返回
             cursor.execute(select_sql, (creator_name, strategy_name))
             params = cursor.fetchall()
 
-            # 格式化时间字段
-            for param in params:
-                if param["creation_time"]:
-                    param["creation_time"] = param["creation_time"].strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                if param["update_time"]:
-                    param["update_time"] = param["update_time"].strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-
             return jsonify({"code": 200, "message": "获取策略参数成功", "data": params})
 
         finally:
             connection.close()
 
     except Exception as e:
-        logger.error(f"获取策略参数过程中发生错误: {str(e)}")
+        logger.error("获取策略参数过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": "获取策略参数失败，请重试"})
 
 
+SQL_INSERT_STRATEGY_PARAM_REL = """
+INSERT INTO StrategyParamRel
+(strategy_creator_name, strategy_name, param_creator_name, param_name)
+VALUES (%s, %s, %s, %s)
+"""
+
+
 # 添加策略参数关系API
 @app.route("/api/strategies/<creator_name>/<strategy_name>/params", methods=["POST"])
 @token_required
@@ -2240,41 +2863,21 @@ def add_strategy_param(current_user, creator_name, strategy_name):
         try:
             cursor = connection.cursor()
 
-            # 检查策略是否存在
-            strategy_check_sql = "SELECT COUNT(*) as count FROM Strategy WHERE creator_name = %s AND strategy_name = %s"
-            cursor.execute(strategy_check_sql, (creator_name, strategy_name))
-            if cursor.fetchone()["count"] == 0:
-                return jsonify({"code": 404, "message": "策略不存在"})
-
-            # 检查参数是否存在
-            param_check_sql = "SELECT COUNT(*) as count FROM Param WHERE creator_name = %s AND param_name = %s"
-            cursor.execute(param_check_sql, (param_creator_name, param_name))
-            if cursor.fetchone()["count"] == 0:
-                return jsonify({"code": 404, "message": "参数不存在"})
-
-            # 检查关系是否已存在
-            rel_check_sql = """
-            SELECT COUNT(*) as count FROM StrategyParamRel 
-            WHERE strategy_creator_name = %s AND strategy_name = %s 
-              AND param_creator_name = %s AND param_name = %s
-            """
-            cursor.execute(
-                rel_check_sql,
-                (creator_name, strategy_name, param_creator_name, param_name),
-            )
-            if cursor.fetchone()["count"] > 0:
-                return jsonify({"code": 400, "message": "参数关系已存在"})
-
-            # 插入关系记录
-            insert_sql = """
-            INSERT INTO StrategyParamRel 
-            (strategy_creator_name, strategy_name, param_creator_name, param_name)
-            VALUES (%s, %s, %s, %s)
-            """
-            cursor.execute(
-                insert_sql,
-                (creator_name, strategy_name, param_creator_name, param_name),
-            )
+            # 插入关系记录，策略和参数是否存在由外键约束判断，关系是否已存在由主键约束判断
+            try:
+                cursor.execute(
+                    SQL_INSERT_STRATEGY_PARAM_REL,
+                    (creator_name, strategy_name, param_creator_name, param_name),
+                )
+            except mysql_driver.IntegrityError as e:
+                if e.args[0] == ER.DUP_ENTRY:
+                    return jsonify({"code": 400, "message": "参数关系已存在"})
+                if e.args[0] == ER.NO_REFERENCED_ROW_2:
+                    if "fk_rel_strategy" in str(e):
+                        return jsonify({"code": 404, "message": "策略不存在"})
+                    if "fk_rel_param_strategy" in str(e):
+                        return jsonify({"code": 404, "message": "参数不存在"})
+                raise
 
             connection.commit()
 
@@ -2284,7 +2887,7 @@ def add_strategy_param(current_user, creator_name, strategy_name):
             connection.close()
 
     except Exception as e:
-        logger.error(f"添加策略参数关系过程中发生错误: {str(e)}")
+        logger.error("添加策略参数关系过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": "添加策略参数关系失败，请重试"})
 
 
@@ -2338,7 +2941,7 @@ def remove_strategy_param(
             connection.close()
 
     except Exception as e:
-        logger.error(f"删除策略参数关系过程中发生错误: {str(e)}")
+        logger.error("删除策略参数关系过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": "删除策略参数关系失败，请重试"})
 
 
@@ -2347,6 +2950,14 @@ def remove_strategy_param(
 # =============================================
 
 
+# 指标列表查询结果缓存，键为指标表版本号加筛选和分页条件，值为(指标列表, 总数, 下一页游标)
+# 指标表有任何写入时调用indicator_list_version.bump()，所有工作进程的旧结果随之失效
+indicator_list_cache = TTLCache(maxsize=500, ttl=30)
+indicator_list_version = SharedVersion(
+    os.path.join(CACHE_VERSION_DIR, "indicator_list")
+)
+
+
 # 获取指标列表API
 @app.route("/api/indicators", methods=["GET"])
 @token_required
@@ -2361,115 +2972,186 @@ def get_indicators(current_user):
             "creator_name", ""
         ).strip()  # 前端直接发送creator_name
         is_enabled = request.args.get("is_enabled", "all")  # 前端发送的是 is_enabled
+        # 不需要总数的客户端可传入include_total=0跳过计数
+        include_total = request.args.get("include_total", "1") in ("1", "true")
+        # 传入cursor时按(creator_name, indicator_name)游标分页，否则沿用page分页
+        page_cursor = request.args.get("cursor")
+        after_key = None
+        if page_cursor:
+            try:
+                after_key = decode_page_cursor(page_cursor, 2)
+            except ValueError as e:
+                return jsonify({"message": str(e)}), 400
+
+        cache_key = (
+            indicator_list_version.get(),
+            creator_name_filter,
+            is_enabled,
+            search_keyword,
+            include_total,
+            page,
+            page_size,
+            page_cursor,
+        )
+        # 相同条件的查询在缓存有效期内直接复用结果
+        cached = indicator_list_cache.get(cache_key)
+        if cached is not None:
+            formatted_indicators, total, next_cursor = cached
+        else:
+            connection = get_db_connection()
+            try:
+                with connection.cursor() as cursor:
+                    # 构建基础查询SQL，需要总数时用窗口函数随数据一起返回；
+                    # 游标分页时窗口函数只能数到游标之后的行，总数改为单独统计
+                    if include_total and after_key is None:
+                        total_column = ", COUNT(*) OVER() AS total"
+                    else:
+                        total_column = ""
+                    base_sql = f"""
+                    SELECT 
+                        CONCAT(creator_name, '.', indicator_name) as id,
+                        creator_name,
+                        indicator_name,
+                        calculation_method,
+                        description,
+                        is_active,
+                        DATE_FORMAT(creation_time, '%%Y-%%m-%%d %%H:%%i:%%s') as create_time{total_column}
+                    FROM Indicator
+                    WHERE 1=1
+                    """
 
-        connection = get_db_connection()
-        try:
-            with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
-
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = current_user_info["user_name"]
-
-                # 构建基础查询SQL
-                base_sql = """
-                SELECT 
-                    CONCAT(creator_name, '.', indicator_name) as id,
-                    creator_name,
-                    indicator_name,
-                    calculation_method,
-                    description,
-                    is_active,
-                    DATE_FORMAT(creation_time, '%%Y-%%m-%%d %%H:%%i:%%s') as create_time
-                FROM Indicator
-                WHERE 1=1
-                """
-
-                # 构建WHERE条件
-                where_conditions = []
-                query_params = []
-
-                # 根据创建者筛选（前端直接发送creator_name）
-                if creator_name_filter:
-                    where_conditions.append("creator_name = %s")
-                    query_params.append(creator_name_filter)
+                    # 构建WHERE条件
+                    where_conditions = []
+                    query_params = []
+
+                    # 根据创建者筛选（前端直接发送creator_name）
+                    if creator_name_filter:
+                        where_conditions.append("creator_name = %s")
+                        query_params.append(creator_name_filter)
+
+                    # 根据状态筛选
+                    if is_enabled != "all":
+                        where_conditions.append("is_active = %s")
+                        query_params.append(int(is_enabled) == 1)
+
+                    # 根据搜索关键词筛选
+                    if len(search_keyword) >= 2:
+                        # 走ngram全文索引，整个关键词作为短语匹配，效果等同子串搜索
+                        where_conditions.append(
+                            "MATCH(indicator_name, description) AGAINST (%s IN BOOLEAN MODE)"
+                        )
+                        query_params.append(
+                            '"' + search_keyword.replace('"', " ") + '"'
+                        )
+                    elif search_keyword:
+                        # 单个字符构不成ngram词元（默认长度2），仍使用LIKE
+                        where_conditions.append(
+                            "(indicator_name LIKE %s OR description LIKE %s)"
+                        )
+                        query_params.extend(
+                            [f"%{search_keyword}%", f"%{search_keyword}%"]
+                        )
 
-                # 根据状态筛选
-                if is_enabled != "all":
-                    where_conditions.append("is_active = %s")
-                    query_params.append(int(is_enabled) == 1)
+                    # 组装完整的查询SQL
+                    if where_conditions:
+                        count_sql = f"SELECT COUNT(*) as total FROM Indicator WHERE {' AND '.join(where_conditions)}"
+                        data_sql = f"{base_sql} AND {' AND '.join(where_conditions)}"
+                    else:
+                        count_sql = "SELECT COUNT(*) as total FROM Indicator"
+                        data_sql = base_sql
+
+                    # 分页查询数据，总数与数据在同一次查询中取得
+                    if after_key is not None:
+                        # 游标分页：从主键索引上一页最后一行之后开始读取，不再扫描被跳过的行
+                        data_sql += " AND (creator_name > %s OR (creator_name = %s AND indicator_name > %s))"
+                        data_sql += " ORDER BY creator_name, indicator_name LIMIT %s"
+                        page_params = [
+                            after_key[0],
+                            after_key[0],
+                            after_key[1],
+                            page_size,
+                        ]
+                    else:
+                        data_sql += (
+                            " ORDER BY creator_name, indicator_name LIMIT %s OFFSET %s"
+                        )
+                        page_params = [page_size, (page - 1) * page_size]
+                    cursor.execute(data_sql, query_params + page_params)
+                    indicators = cursor.fetchall()
+
+                    total = None
+                    if include_total:
+                        if indicators and after_key is None:
+                            total = indicators[0]["total"]
+                        elif after_key is None and page == 1:
+                            total = 0
+                        else:
+                            # 页码超出范围时窗口函数拿不到总数，单独统计一次
+                            cursor.execute(count_sql, query_params)
+                            total_result = cursor.fetchone()
+                            total = total_result["total"] if total_result else 0
+
+                    # 本页已满时返回下一页游标
+                    next_cursor = None
+                    if len(indicators) == page_size:
+                        last = indicators[-1]
+                        next_cursor = encode_page_cursor(
+                            (last["creator_name"], last["indicator_name"])
+                        )
 
-                # 根据搜索关键词筛选
-                if search_keyword:
-                    where_conditions.append(
-                        "(indicator_name LIKE %s OR description LIKE %s)"
-                    )
-                    query_params.extend([f"%{search_keyword}%", f"%{search_keyword}%"])
+                    # 查询列已是返回格式，行字典原地转换is_active后直接返回
+                    for indicator in indicators:
+                        indicator.pop("total", None)
+                        indicator["is_active"] = bool(indicator["is_active"])
+                    formatted_indicators = indicators
 
-                # 组装完整的查询SQL
-                if where_conditions:
-                    count_sql = f"SELECT COUNT(*) as total FROM Indicator WHERE {' AND '.join(where_conditions)}"
-                    data_sql = f"{base_sql} AND {' AND '.join(where_conditions)} ORDER BY creator_name, indicator_name"
-                else:
-                    count_sql = "SELECT COUNT(*) as total FROM Indicator"
-                    data_sql = f"{base_sql} ORDER BY creator_name, indicator_name"
-
-                # 获取总数
-                cursor.execute(count_sql, query_params)
-                total_result = cursor.fetchone()
-                total = total_result["total"] if total_result else 0
-
-                # 分页查询数据
-                offset = (page - 1) * page_size
-                data_sql += f" LIMIT %s OFFSET %s"
-                query_params.extend([page_size, offset])
-
-                cursor.execute(data_sql, query_params)
-                indicators = cursor.fetchall()
-
-                # 格式化返回数据
-                formatted_indicators = []
-                for indicator in indicators:
-                    formatted_indicators.append(
-                        {
-                            "id": indicator["id"],
-                            "creator_name": indicator["creator_name"],
-                            "indicator_name": indicator["indicator_name"],
-                            "calculation_method": indicator["calculation_method"],
-                            "description": indicator["description"],
-                            "is_active": bool(indicator["is_active"]),
-                            "create_time": indicator["create_time"],
-                        }
+                    indicator_list_cache.set(
+                        cache_key, (formatted_indicators, total, next_cursor)
                     )
+            finally:
+                connection.close()
 
-                return (
-                    jsonify(
-                        {
-                            "data": formatted_indicators,
-                            "pagination": {
-                                "total": total,
-                                "page": page,
-                                "page_size": page_size,
-                                "pages": (total + page_size - 1) // page_size,
-                            },
-                            "message": "获取指标列表成功",
-                        }
-                    ),
-                    200,
-                )
-
-        finally:
-            connection.close()
+        return (
+            jsonify(
+                {
+                    "data": formatted_indicators,
+                    "pagination": {
+                        "total": total,
+                        "page": page,
+                        "page_size": page_size,
+                        "pages": page_count(total, page_size),
+                        "next_cursor": next_cursor,
+                    },
+                    "message": "获取指标列表成功",
+                }
+            ),
+            200,
+        )
 
     except Exception as e:
-        logger.error(f"获取指标列表过程中发生错误: {str(e)}")
+        logger.error("获取指标列表过程中发生错误: %s", e)
         return jsonify({"message": f"获取指标列表失败: {str(e)}"}), 500
 
 
+# 指标增改相关SQL语句（模块级常量，避免每次请求重新构造）
+SQL_INDICATOR_EXISTS = (
+    "SELECT 1 FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
+)
+SQL_GET_INDICATOR = (
+    "SELECT * FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
+)
+SQL_INSERT_INDICATOR = """
+INSERT INTO Indicator (creator_name, indicator_name, calculation_method, description, is_active)
+VALUES (%s, %s, %s, %s, %s)
+"""
+# 直接在数据库中取反启用状态，无需先读出当前状态
+SQL_TOGGLE_INDICATOR = """
+UPDATE Indicator
+SET is_active = NOT is_active, update_time = NOW()
+WHERE creator_name = %s AND indicator_name = %s
+"""
+
+
 # 复制指标API
 @app.route("/api/indicators/<indicator_composite_id>/copy", methods=["POST"])
 @token_required
@@ -2490,32 +3172,22 @@ def copy_indicator(current_user, indicator_composite_id):
         )
         new_description = data.get("description", "")
 
-        # 获取当前用户信息
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 获取当前用户名
-                cursor.execute(
-                    "SELECT user_name FROM User WHERE user_id = %s",
-                    (current_user["user_id"],),
-                )
-                user_info = cursor.fetchone()
-                if not user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = user_info["user_name"]
+                # 用户名直接取自token，无需再查询User表
+                current_user_name = current_user["user_name"]
 
                 # 检查新指标名称是否已存在
                 cursor.execute(
-                    "SELECT 1 FROM Indicator WHERE creator_name = %s AND indicator_name = %s",
-                    (current_user_name, new_indicator_name),
+                    SQL_INDICATOR_EXISTS, (current_user_name, new_indicator_name)
                 )
                 if cursor.fetchone():
                     return jsonify({"message": "指标名称已存在"}), 400
 
                 # 获取原始指标信息
                 cursor.execute(
-                    "SELECT * FROM Indicator WHERE creator_name = %s AND indicator_name = %s",
+                    "SELECT calculation_method, description FROM Indicator WHERE creator_name = %s AND indicator_name = %s",
                     (original_creator_name, original_indicator_name),
                 )
                 original_indicator = cursor.fetchone()
@@ -2524,10 +3196,7 @@ def copy_indicator(current_user, indicator_composite_id):
 
                 # 创建新指标
                 cursor.execute(
-                    """
-                    INSERT INTO Indicator (creator_name, indicator_name, calculation_method, description, is_active)
-                    VALUES (%s, %s, %s, %s, %s)
-                    """,
+                    SQL_INSERT_INDICATOR,
                     (
                         current_user_name,
                         new_indicator_name,
@@ -2563,6 +3232,7 @@ def copy_indicator(current_user, indicator_composite_id):
                     )
 
                 connection.commit()
+                indicator_list_version.bump()
 
                 return (
                     jsonify(
@@ -2581,7 +3251,7 @@ def copy_indicator(current_user, indicator_composite_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"复制指标过程中发生错误: {str(e)}")
+        logger.error("复制指标过程中发生错误: %s", e)
         return jsonify({"message": "复制指标失败，请重试"}), 500
 
 
@@ -2621,47 +3291,36 @@ def create_indicator(current_user):
             return jsonify({"message": "指标名称和计算函数不能为空"}), 400
 
         # 验证指标名称格式（仅允许中英文、数字、下划线）
-        if not re.match(r"^[a-zA-Z0-9_\u4e00-\u9fa5]+$", indicator_name):
+        if not INDICATOR_NAME_RE.match(indicator_name):
             return jsonify({"message": "指标名称只能包含中英文、数字、下划线"}), 400
 
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
-
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = current_user_info["user_name"]
+                # 用户名直接取自token，无需再查询User表
+                current_user_name = current_user["user_name"]
 
-                # 检查指标名称是否已存在（同一创建者下）
-                check_sql = "SELECT * FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
-                cursor.execute(check_sql, (current_user_name, indicator_name))
-                if cursor.fetchone():
-                    return (
-                        jsonify({"message": f'指标名称 "{indicator_name}" 已存在'}),
-                        400,
+                # 插入新指标，名称是否已存在（同一创建者下）由主键约束判断
+                try:
+                    cursor.execute(
+                        SQL_INSERT_INDICATOR,
+                        (
+                            current_user_name,
+                            indicator_name,
+                            calculation_method,
+                            description,
+                            is_active,
+                        ),
                     )
-
-                # 插入新指标
-                insert_sql = """
-                INSERT INTO Indicator (creator_name, indicator_name, calculation_method, description, is_active)
-                VALUES (%s, %s, %s, %s, %s)
-                """
-                cursor.execute(
-                    insert_sql,
-                    (
-                        current_user_name,
-                        indicator_name,
-                        calculation_method,
-                        description,
-                        is_active,
-                    ),
-                )
+                except mysql_driver.IntegrityError as e:
+                    if e.args[0] == ER.DUP_ENTRY:
+                        return (
+                            jsonify({"message": f'指标名称 "{indicator_name}" 已存在'}),
+                            400,
+                        )
+                    raise
                 connection.commit()
+                indicator_list_version.bump()
 
                 # 返回创建的指标信息
                 new_indicator = {
@@ -2680,7 +3339,7 @@ def create_indicator(current_user):
             connection.close()
 
     except Exception as e:
-        logger.error(f"创建指标过程中发生错误: {str(e)}")
+        logger.error("创建指标过程中发生错误: %s", e)
         return jsonify({"message": f"创建指标失败: {str(e)}"}), 500
 
 
@@ -2691,13 +3350,10 @@ def update_indicator(current_user, indicator_composite_id):
     """更新指标接口"""
     try:
         # 解析复合ID (格式: creator_name.indicator_name)
-        try:
-            parts = indicator_composite_id.split(".", 1)
-            if len(parts) != 2:
-                return jsonify({"message": "无效的指标ID格式"}), 400
-            creator_name, indicator_name = parts
-        except:
+        parts = indicator_composite_id.split(".", 1)
+        if len(parts) != 2:
             return jsonify({"message": "无效的指标ID格式"}), 400
+        creator_name, indicator_name = parts
 
         data = request.get_json()
 
@@ -2729,24 +3385,17 @@ def update_indicator(current_user, indicator_composite_id):
             return jsonify({"message": "指标名称和计算函数不能为空"}), 400
 
         # 验证指标名称格式
-        if not re.match(r"^[a-zA-Z0-9_\u4e00-\u9fa5]+$", new_indicator_name):
+        if not INDICATOR_NAME_RE.match(new_indicator_name):
             return jsonify({"message": "指标名称只能包含中英文、数字、下划线"}), 400
 
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
-
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = current_user_info["user_name"]
+                # 用户名直接取自token，无需再查询User表
+                current_user_name = current_user["user_name"]
 
                 # 检查指标是否存在
-                check_sql = "SELECT * FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
+                check_sql = "SELECT DATE_FORMAT(creation_time, '%%Y-%%m-%%d %%H:%%i:%%s') AS create_time FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
                 cursor.execute(check_sql, (creator_name, indicator_name))
                 existing_indicator = cursor.fetchone()
 
@@ -2759,9 +3408,8 @@ def update_indicator(current_user, indicator_composite_id):
 
                 # 如果指标名称有变化，检查新名称是否已存在
                 if new_indicator_name != indicator_name:
-                    check_new_name_sql = "SELECT * FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
                     cursor.execute(
-                        check_new_name_sql, (creator_name, new_indicator_name)
+                        SQL_INDICATOR_EXISTS, (creator_name, new_indicator_name)
                     )
                     if cursor.fetchone():
                         return (
@@ -2775,19 +3423,7 @@ def update_indicator(current_user, indicator_composite_id):
 
                 # 更新指标
                 if new_indicator_name != indicator_name:
-                    # 如果指标名称变化了，需要先更新关联关系，然后更新指标本身
-                    # 更新指标参数关系表中的指标名称引用
-                    update_indicator_rel_sql = """
-                    UPDATE IndicatorParamRel 
-                    SET indicator_name = %s 
-                    WHERE indicator_creator_name = %s AND indicator_name = %s
-                    """
-                    cursor.execute(
-                        update_indicator_rel_sql,
-                        (new_indicator_name, creator_name, indicator_name),
-                    )
-
-                    # 更新指标表
+                    # 指标改名，指标参数关系由外键ON UPDATE CASCADE同步更新
                     update_sql = """
                     UPDATE Indicator 
                     SET indicator_name = %s, calculation_method = %s, description = %s, is_active = %s
@@ -2823,6 +3459,7 @@ def update_indicator(current_user, indicator_composite_id):
                     )
 
                 connection.commit()
+                indicator_list_version.bump()
 
                 # 返回更新后的指标信息
                 updated_indicator = {
@@ -2846,10 +3483,28 @@ def update_indicator(current_user, indicator_composite_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"更新指标过程中发生错误: {str(e)}")
+        logger.error("更新指标过程中发生错误: %s", e)
         return jsonify({"message": f"更新指标失败: {str(e)}"}), 500
 
 
+# 仅当指标未被任何参数引用时才删除
+SQL_DELETE_UNUSED_INDICATOR = """
+DELETE FROM Indicator
+WHERE creator_name = %s AND indicator_name = %s
+  AND NOT EXISTS (
+      SELECT 1 FROM Param
+      WHERE data_id = %s AND param_type = 'indicator'
+  )
+"""
+SQL_INDICATOR_DELETE_CHECK = """
+SELECT
+    (SELECT COUNT(*) FROM Indicator
+     WHERE creator_name = %s AND indicator_name = %s) AS indicator_count,
+    (SELECT COUNT(*) FROM Param
+     WHERE data_id = %s AND param_type = 'indicator') AS param_count
+"""
+
+
 # 删除指标API
 @app.route("/api/indicators/<indicator_composite_id>", methods=["DELETE"])
 @token_required
@@ -2857,81 +3512,54 @@ def delete_indicator(current_user, indicator_composite_id):
     """删除指标接口"""
     try:
         # 解析复合ID (格式: creator_name.indicator_name)
-        try:
-            parts = indicator_composite_id.split(".", 1)
-            if len(parts) != 2:
-                return jsonify({"message": "无效的指标ID格式"}), 400
-            creator_name, indicator_name = parts
-        except:
+        parts = indicator_composite_id.split(".", 1)
+        if len(parts) != 2:
             return jsonify({"message": "无效的指标ID格式"}), 400
+        creator_name, indicator_name = parts
 
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
-
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = current_user_info["user_name"]
-
-                # 检查指标是否存在
-                check_sql = "SELECT * FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
-                cursor.execute(check_sql, (creator_name, indicator_name))
-                existing_indicator = cursor.fetchone()
+                # 用户名直接取自token，无需再查询User表
+                current_user_name = current_user["user_name"]
 
-                if not existing_indicator:
-                    return jsonify({"message": "指标不存在"}), 404
+                data_id = f"{creator_name}.{indicator_name}"
 
-                # 检查权限（只能删除自己创建的指标）
+                # 他人创建的指标：先确认指标存在（不存在时返回404），再拒绝删除
                 if creator_name != current_user_name:
+                    cursor.execute(
+                        SQL_INDICATOR_DELETE_CHECK,
+                        (creator_name, indicator_name, data_id),
+                    )
+                    if not cursor.fetchone()["indicator_count"]:
+                        return jsonify({"message": "指标不存在"}), 404
                     return jsonify({"message": "无权限删除他人创建的指标"}), 403
 
-                # 检查指标是否被参数引用
-                check_param_rel_sql = """
-                SELECT COUNT(*) as count
-                FROM Param p
-                WHERE p.param_type = 'indicator' AND p.data_id LIKE %s
-                """
+                # 常见情况是删除未被参数引用的指标：用一条带条件的DELETE直接完成，
+                # 指标参数关系由外键ON DELETE CASCADE一并删除
                 cursor.execute(
-                    check_param_rel_sql, (f"{creator_name}.{indicator_name}%",)
+                    SQL_DELETE_UNUSED_INDICATOR, (creator_name, indicator_name, data_id)
                 )
-                param_usage = cursor.fetchone()
+                if not cursor.rowcount:
+                    # 删除未生效时，一次查询取得指标是否存在和引用它的参数数量以确定原因
+                    cursor.execute(
+                        SQL_INDICATOR_DELETE_CHECK,
+                        (creator_name, indicator_name, data_id),
+                    )
+                    check_result = cursor.fetchone()
+                    if not check_result["indicator_count"]:
+                        return jsonify({"message": "指标不存在"}), 404
 
-                if param_usage and param_usage["count"] > 0:
                     return (
                         jsonify(
                             {
-                                "message": f'指标正在被 {param_usage["count"]} 个参数使用，无法删除。请先删除相关参数。'
+                                "message": f'指标正在被 {check_result["param_count"]} 个参数使用，无法删除。请先删除相关参数。'
                             }
                         ),
                         400,
                     )
-
-                # 检查指标是否有参数关系
-                check_indicator_rel_sql = """
-                SELECT COUNT(*) as count
-                FROM IndicatorParamRel ipr
-                WHERE ipr.indicator_creator_name = %s AND ipr.indicator_name = %s
-                """
-                cursor.execute(check_indicator_rel_sql, (creator_name, indicator_name))
-                rel_count = cursor.fetchone()
-
-                # 删除指标参数关系（如果有）
-                if rel_count and rel_count["count"] > 0:
-                    delete_rel_sql = """
-                    DELETE FROM IndicatorParamRel 
-                    WHERE indicator_creator_name = %s AND indicator_name = %s
-                    """
-                    cursor.execute(delete_rel_sql, (creator_name, indicator_name))
-
-                # 删除指标
-                delete_sql = "DELETE FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
-                cursor.execute(delete_sql, (creator_name, indicator_name))
                 connection.commit()
+                indicator_list_version.bump()
 
                 return jsonify({"message": "指标删除成功"}), 200
 
@@ -2939,7 +3567,7 @@ def delete_indicator(current_user, indicator_composite_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"删除指标过程中发生错误: {str(e)}")
+        logger.error("删除指标过程中发生错误: %s", e)
         return jsonify({"message": f"删除指标失败: {str(e)}"}), 500
 
 
@@ -2956,6 +3584,16 @@ def get_indicator_param_relations(current_user):
         param_name = request.args.get("param_name", "").strip()
         page = int(request.args.get("page", 1))
         limit = int(request.args.get("limit", 10))
+        # 不需要总数的客户端可传入include_total=0跳过计数
+        include_total = request.args.get("include_total", "1") in ("1", "true")
+        # 传入cursor时按主键四元组游标分页，否则沿用page分页
+        page_cursor = request.args.get("cursor")
+        after_key = None
+        if page_cursor:
+            try:
+                after_key = decode_page_cursor(page_cursor, 4)
+            except ValueError as e:
+                return jsonify({"message": str(e)}), 400
 
         connection = get_db_connection()
         try:
@@ -2984,17 +3622,29 @@ def get_indicator_param_relations(current_user):
                 if conditions:
                     where_clause = "WHERE " + " AND ".join(conditions)
 
-                # 查询总数
-                count_sql = f"""
-                SELECT COUNT(*) as total
-                FROM IndicatorParamRel ipr
-                {where_clause}
-                """
-                cursor.execute(count_sql, params)
-                total_count = cursor.fetchone()["total"]
+                # 游标分页：按主键从上一页最后一行之后开始读取，不再扫描被跳过的行
+                page_clause = "LIMIT %s OFFSET %s"
+                page_params = [limit, (page - 1) * limit]
+                data_where_clause = where_clause
+                if after_key is not None:
+                    keyset_condition = (
+                        "(ipr.indicator_creator_name, ipr.indicator_name,"
+                        " ipr.param_creator_name, ipr.param_name) > (%s, %s, %s, %s)"
+                    )
+                    data_where_clause = "WHERE " + " AND ".join(
+                        conditions + [keyset_condition]
+                    )
+                    page_clause = "LIMIT %s"
+                    page_params = list(after_key) + [limit]
 
-                # 查询数据
-                offset = (page - 1) * limit
+                # 查询数据，需要总数时用窗口函数随数据一起返回；
+                # 游标分页时窗口函数只能数到游标之后的行，总数改为单独统计
+                if include_total and after_key is None:
+                    total_column = ", COUNT(*) OVER() AS total"
+                else:
+                    total_column = ""
+                # 先只在关系表上筛选、分页（筛选条件只涉及关系表），
+                # 再为本页的关系行关联指标和参数信息，不必为全部匹配行做关联
                 sql = f"""
                 SELECT 
                     ipr.*,
@@ -3005,19 +3655,54 @@ def get_indicator_param_relations(current_user):
                     p.pre_period,
                     p.post_period,
                     p.agg_func
-                FROM IndicatorParamRel ipr
+                FROM (
+                    SELECT ipr.*{total_column}
+                    FROM IndicatorParamRel ipr
+                    {data_where_clause}
+                    ORDER BY ipr.indicator_creator_name, ipr.indicator_name, ipr.param_creator_name, ipr.param_name
+                    {page_clause}
+                ) ipr
                 LEFT JOIN Indicator i ON ipr.indicator_creator_name = i.creator_name 
                     AND ipr.indicator_name = i.indicator_name
                 LEFT JOIN Param p ON ipr.param_creator_name = p.creator_name 
                     AND ipr.param_name = p.param_name
-                {where_clause}
                 ORDER BY ipr.indicator_creator_name, ipr.indicator_name, ipr.param_creator_name, ipr.param_name
-                LIMIT %s OFFSET %s
                 """
 
-                cursor.execute(sql, params + [limit, offset])
+                cursor.execute(sql, params + page_params)
                 relations = cursor.fetchall()
 
+                total_count = None
+                if include_total:
+                    if relations and after_key is None:
+                        total_count = relations[0]["total"]
+                        for relation in relations:
+                            del relation["total"]
+                    elif after_key is None and page == 1:
+                        total_count = 0
+                    else:
+                        # 页码超出范围时窗口函数拿不到总数，单独统计一次
+                        count_sql = f"""
+                        SELECT COUNT(*) as total
+                        FROM IndicatorParamRel ipr
+                        {where_clause}
+                        """
+                        cursor.execute(count_sql, params)
+                        total_count = cursor.fetchone()["total"]
+
+                # 本页已满时返回下一页游标
+                next_cursor = None
+                if len(relations) == limit:
+                    last = relations[-1]
+                    next_cursor = encode_page_cursor(
+                        (
+                            last["indicator_creator_name"],
+                            last["indicator_name"],
+                            last["param_creator_name"],
+                            last["param_name"],
+                        )
+                    )
+
                 return (
                     jsonify(
                         {
@@ -3026,7 +3711,8 @@ def get_indicator_param_relations(current_user):
                                 "page": page,
                                 "limit": limit,
                                 "total": total_count,
-                                "pages": (total_count + limit - 1) // limit,
+                                "pages": page_count(total_count, limit),
+                                "next_cursor": next_cursor,
                             },
                         }
                     ),
@@ -3037,7 +3723,7 @@ def get_indicator_param_relations(current_user):
             connection.close()
 
     except Exception as e:
-        logger.error(f"获取指标参数关系列表过程中发生错误: {str(e)}")
+        logger.error("获取指标参数关系列表过程中发生错误: %s", e)
         return jsonify({"message": f"获取关系列表失败: {str(e)}"}), 500
 
 
@@ -3068,55 +3754,31 @@ def create_indicator_param_relation(current_user):
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 验证指标是否存在
-                indicator_check_sql = "SELECT * FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
-                cursor.execute(
-                    indicator_check_sql, (indicator_creator_name, indicator_name)
-                )
-                if not cursor.fetchone():
-                    return jsonify({"message": "指定的指标不存在"}), 404
-
-                # 验证参数是否存在
-                param_check_sql = (
-                    "SELECT * FROM Param WHERE creator_name = %s AND param_name = %s"
-                )
-                cursor.execute(param_check_sql, (param_creator_name, param_name))
-                if not cursor.fetchone():
-                    return jsonify({"message": "指定的参数不存在"}), 404
-
-                # 检查关系是否已存在
-                check_sql = """
-                SELECT * FROM IndicatorParamRel 
-                WHERE indicator_creator_name = %s AND indicator_name = %s 
-                AND param_creator_name = %s AND param_name = %s
-                """
-                cursor.execute(
-                    check_sql,
-                    (
-                        indicator_creator_name,
-                        indicator_name,
-                        param_creator_name,
-                        param_name,
-                    ),
-                )
-                if cursor.fetchone():
-                    return jsonify({"message": "指标参数关系已存在"}), 400
-
-                # 创建关系
+                # 创建关系，指标和参数是否存在由外键约束判断，关系是否已存在由主键约束判断
                 insert_sql = """
                 INSERT INTO IndicatorParamRel 
                 (indicator_creator_name, indicator_name, param_creator_name, param_name)
                 VALUES (%s, %s, %s, %s)
                 """
-                cursor.execute(
-                    insert_sql,
-                    (
-                        indicator_creator_name,
-                        indicator_name,
-                        param_creator_name,
-                        param_name,
-                    ),
-                )
+                try:
+                    cursor.execute(
+                        insert_sql,
+                        (
+                            indicator_creator_name,
+                            indicator_name,
+                            param_creator_name,
+                            param_name,
+                        ),
+                    )
+                except mysql_driver.IntegrityError as e:
+                    if e.args[0] == ER.DUP_ENTRY:
+                        return jsonify({"message": "指标参数关系已存在"}), 400
+                    if e.args[0] == ER.NO_REFERENCED_ROW_2:
+                        if "fk_rel_indicator" in str(e):
+                            return jsonify({"message": "指定的指标不存在"}), 404
+                        if "fk_rel_param_indicator" in str(e):
+                            return jsonify({"message": "指定的参数不存在"}), 404
+                    raise
                 connection.commit()
 
                 # 返回创建的关系信息
@@ -3136,7 +3798,7 @@ def create_indicator_param_relation(current_user):
             connection.close()
 
     except Exception as e:
-        logger.error(f"创建指标参数关系过程中发生错误: {str(e)}")
+        logger.error("创建指标参数关系过程中发生错误: %s", e)
         return jsonify({"message": f"创建关系失败: {str(e)}"}), 500
 
 
@@ -3147,48 +3809,23 @@ def delete_indicator_param_relation(current_user, relation_id):
     """删除指标参数关系"""
     try:
         # 解析关系ID (格式: indicator_creator.indicator_name.param_creator.param_name)
-        try:
-            parts = relation_id.split(".")
-            if len(parts) != 4:
-                return (
-                    jsonify(
-                        {
-                            "message": "无效的关系ID格式，应为indicator_creator.indicator_name.param_creator.param_name"
-                        }
-                    ),
-                    400,
-                )
-
-            indicator_creator_name, indicator_name, param_creator_name, param_name = (
-                parts
+        # 参数名可能包含点号，最多只拆分前三个点
+        parts = relation_id.split(".", 3)
+        if len(parts) != 4:
+            return (
+                jsonify(
+                    {
+                        "message": "无效的关系ID格式，应为indicator_creator.indicator_name.param_creator.param_name"
+                    }
+                ),
+                400,
             )
-
-        except Exception as parse_error:
-            logger.error(f"解析关系ID失败: {str(parse_error)}")
-            return jsonify({"message": "无效的关系ID格式"}), 400
+        indicator_creator_name, indicator_name, param_creator_name, param_name = parts
 
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 检查关系是否存在
-                check_sql = """
-                SELECT * FROM IndicatorParamRel 
-                WHERE indicator_creator_name = %s AND indicator_name = %s 
-                AND param_creator_name = %s AND param_name = %s
-                """
-                cursor.execute(
-                    check_sql,
-                    (
-                        indicator_creator_name,
-                        indicator_name,
-                        param_creator_name,
-                        param_name,
-                    ),
-                )
-                if not cursor.fetchone():
-                    return jsonify({"message": "指标参数关系不存在"}), 404
-
-                # 删除关系
+                # 删除关系，没有删除任何行说明关系不存在
                 delete_sql = """
                 DELETE FROM IndicatorParamRel 
                 WHERE indicator_creator_name = %s AND indicator_name = %s 
@@ -3203,6 +3840,8 @@ def delete_indicator_param_relation(current_user, relation_id):
                         param_name,
                     ),
                 )
+                if cursor.rowcount == 0:
+                    return jsonify({"message": "指标参数关系不存在"}), 404
                 connection.commit()
 
                 return jsonify({"message": "指标参数关系删除成功"}), 200
@@ -3211,7 +3850,7 @@ def delete_indicator_param_relation(current_user, relation_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"删除指标参数关系过程中发生错误: {str(e)}")
+        logger.error("删除指标参数关系过程中发生错误: %s", e)
         return jsonify({"message": f"删除关系失败: {str(e)}"}), 500
 
 
@@ -3222,60 +3861,36 @@ def toggle_indicator_status(current_user, indicator_composite_id):
     """切换指标启用/禁用状态"""
     try:
         # 解析复合ID (格式: creator_name.indicator_name)
-        try:
-            parts = indicator_composite_id.split(".", 1)
-            if len(parts) != 2:
-                return jsonify({"message": "无效的指标ID格式"}), 400
-            creator_name, indicator_name = parts
-        except:
+        parts = indicator_composite_id.split(".", 1)
+        if len(parts) != 2:
             return jsonify({"message": "无效的指标ID格式"}), 400
+        creator_name, indicator_name = parts
 
         connection = get_db_connection()
         try:
             with connection.cursor() as cursor:
-                # 获取当前用户信息
-                user_sql = "SELECT user_name FROM User WHERE user_id = %s"
-                cursor.execute(user_sql, (current_user["user_id"],))
-                current_user_info = cursor.fetchone()
-
-                if not current_user_info:
-                    return jsonify({"message": "用户不存在"}), 404
-
-                current_user_name = current_user_info["user_name"]
-
-                # 检查指标是否存在
-                check_sql = "SELECT * FROM Indicator WHERE creator_name = %s AND indicator_name = %s"
-                cursor.execute(check_sql, (creator_name, indicator_name))
-                existing_indicator = cursor.fetchone()
-
-                if not existing_indicator:
-                    return jsonify({"message": "指标不存在"}), 404
+                # 用户名直接取自token，无需再查询User表
+                current_user_name = current_user["user_name"]
 
-                # 检查权限（只能修改自己创建的指标状态）
+                # 检查权限（只能修改自己创建的指标状态），区分指标不存在和无权限
                 if creator_name != current_user_name:
+                    cursor.execute(SQL_INDICATOR_EXISTS, (creator_name, indicator_name))
+                    if not cursor.fetchone():
+                        return jsonify({"message": "指标不存在"}), 404
                     return jsonify({"message": "无权限修改他人创建的指标状态"}), 403
 
-                # 切换状态
-                current_status = existing_indicator["is_active"]
-                new_status = 0 if current_status == 1 else 1
-
-                # 更新状态
-                update_sql = """
-                UPDATE Indicator 
-                SET is_active = %s, update_time = %s 
-                WHERE creator_name = %s AND indicator_name = %s
-                """
-                cursor.execute(
-                    update_sql,
-                    (new_status, datetime.now(), creator_name, indicator_name),
-                )
+                # 切换状态，没有匹配任何行说明指标不存在
+                cursor.execute(SQL_TOGGLE_INDICATOR, (creator_name, indicator_name))
+                if cursor.rowcount == 0:
+                    return jsonify({"message": "指标不存在"}), 404
                 connection.commit()
+                indicator_list_version.bump()
 
                 # 获取更新后的指标信息
-                cursor.execute(check_sql, (creator_name, indicator_name))
+                cursor.execute(SQL_GET_INDICATOR, (creator_name, indicator_name))
                 updated_indicator = cursor.fetchone()
 
-                status_text = "启用" if new_status == 1 else "禁用"
+                status_text = "启用" if updated_indicator["is_active"] else "禁用"
 
                 return (
                     jsonify(
@@ -3288,7 +3903,7 @@ def toggle_indicator_status(current_user, indicator_composite_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"切换指标状态过程中发生错误: {str(e)}")
+        logger.error("切换指标状态过程中发生错误: %s", e)
         return jsonify({"message": f"状态切换失败: {str(e)}"}), 500
 
 
@@ -3363,7 +3978,7 @@ def get_messages(current_user):
                 # 处理JSON字段
                 if message.get("link_params"):
                     try:
-                        message["link_params"] = json.loads(message["link_params"])
+                        message["link_params"] = json_loads(message["link_params"])
                     except (json.JSONDecodeError, TypeError):
                         message["link_params"] = None
 
@@ -3386,7 +4001,7 @@ def get_messages(current_user):
             connection.close()
 
     except Exception as e:
-        logger.error(f"获取消息列表过程中发生错误: {str(e)}")
+        logger.error("获取消息列表过程中发生错误: %s", e)
         return jsonify({"message": f"获取消息列表失败: {str(e)}"}), 500
 
 
@@ -3429,7 +4044,7 @@ def mark_message_read(current_user, message_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"标记消息已读过程中发生错误: {str(e)}")
+        logger.error("标记消息已读过程中发生错误: %s", e)
         return jsonify({"message": f"标记消息已读失败: {str(e)}"}), 500
 
 
@@ -3466,7 +4081,7 @@ def delete_message(current_user, message_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"删除消息过程中发生错误: {str(e)}")
+        logger.error("删除消息过程中发生错误: %s", e)
         return jsonify({"message": f"删除消息失败: {str(e)}"}), 500
 
 
@@ -3476,9 +4091,7 @@ def create_message(
 ):
     """创建新消息（内部函数）"""
     try:
-        import uuid
-
-        message_id = str(uuid.uuid4())
+        message_id = str(uuid7())
 
         connection = get_db_connection()
         if connection is None:
@@ -3502,7 +4115,7 @@ def create_message(
                     title,
                     content,
                     link_url,
-                    json.dumps(link_params) if link_params else None,
+                    json_dumps(link_params) if link_params else None,
                     datetime.now(),
                 ),
             )
@@ -3514,7 +4127,7 @@ def create_message(
             connection.close()
 
     except Exception as e:
-        logger.error(f"创建消息失败: {str(e)}")
+        logger.error("创建消息失败: %s", e)
         return False
 
 
@@ -3540,19 +4153,25 @@ def start_backtest(current_user):
             return jsonify({"message": "缺少必要参数"}), 400
 
         current_user_name = current_user["user_name"]
-        report_id = str(uuid.uuid4())
+        report_id = str(uuid7())
 
-        # 启动异步回测任务
-        import threading
+        def write_report(sql, params):
+            """写一次回测报告，每次写入时才从连接池取连接，回测计算期间不占用连接"""
+            connection = get_db_connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(sql, params)
+                connection.commit()
+            finally:
+                connection.close()
 
+        # 启动异步回测任务
         def backtest_task():
-            connection = None
+            report_created = False
             try:
                 # 初始化回测报告记录
-                connection = get_db_connection()
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        """
+                write_report(
+                    """
                         INSERT INTO BacktestReport (
                             report_id, creator_name, strategy_name, user_name,
                             start_date, end_date, initial_fund, final_fund, 
@@ -3560,20 +4179,22 @@ def start_backtest(current_user):
                             win_rate, profit_loss_ratio, trade_count, report_status
                         ) VALUES (%s, %s, %s, %s, %s, %s, %s, 0, 0, 0, 0, 0, 0, 0, 0, 'generating')
                     """,
-                        (
-                            report_id,
-                            strategy_creator,
-                            strategy_name,
-                            current_user_name,
-                            start_date,
-                            end_date,
-                            initial_fund,
-                        ),
-                    )
-                    connection.commit()
+                    (
+                        report_id,
+                        strategy_creator,
+                        strategy_name,
+                        current_user_name,
+                        start_date,
+                        end_date,
+                        initial_fund,
+                    ),
+                )
+                report_created = True
 
                 # 第一阶段：数据准备
-                logger.info(f"开始数据准备，策略: {strategy_creator}.{strategy_name}")
+                logger.info(
+                    "开始数据准备，策略: %s.%s", strategy_creator, strategy_name
+                )
 
                 preparer = DataPreparer("config.json")
                 strategy_fullname = f"{strategy_creator}.{strategy_name}"
@@ -3592,7 +4213,9 @@ def start_backtest(current_user):
                 )
 
                 # 第二阶段：回测执行
-                logger.info(f"开始执行回测，策略: {strategy_creator}.{strategy_name}")
+                logger.info(
+                    "开始执行回测，策略: %s.%s", strategy_creator, strategy_name
+                )
 
                 # 从数据准备结果中获取策略手续费信息
                 strategy_info = prepared_data.get("strategy_info", {})
@@ -3610,7 +4233,9 @@ def start_backtest(current_user):
                 results = backtest_engine.run_backtest(config, print_log=False)
 
                 # 第三阶段：生成图表数据
-                logger.info(f"生成图表数据，策略: {strategy_creator}.{strategy_name}")
+                logger.info(
+                    "生成图表数据，策略: %s.%s", strategy_creator, strategy_name
+                )
 
                 # 获取基准数据和基准名称（通过DataPreparer统一处理）
                 benchmark_data = preparer.get_benchmark_data()
@@ -3624,13 +4249,15 @@ def start_backtest(current_user):
                         benchmark_data=benchmark_data,
                         benchmark_name=benchmark_name,
                     )
-                    plotly_json_str = json.dumps(plotly_data)
+                    plotly_json_str = json_dumps(plotly_data)
                 except Exception as e:
-                    logger.warning(f"Plotly图表生成失败: {e}")
+                    logger.warning("Plotly图表生成失败: %s", e)
                     plotly_json_str = None
 
                 # 第四阶段：更新回测报告
-                logger.info(f"更新回测报告，策略: {strategy_creator}.{strategy_name}")
+                logger.info(
+                    "更新回测报告，策略: %s.%s", strategy_creator, strategy_name
+                )
 
                 final_fund = results["final_value"]
                 total_return = results["total_return"]
@@ -3657,9 +4284,8 @@ def start_backtest(current_user):
                         profit_loss_ratio = won_avg / lost_avg
 
                 # 更新数据库记录
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        """
+                write_report(
+                    """
                         UPDATE BacktestReport SET
                             final_fund = %s, total_return = %s, annual_return = %s,
                             max_drawdown = %s, sharpe_ratio = %s, win_rate = %s,
@@ -3669,20 +4295,19 @@ def start_backtest(current_user):
                             report_status = 'completed'
                         WHERE report_id = %s
                     """,
-                        (
-                            final_fund,
-                            total_return,
-                            annual_return,
-                            max_drawdown,
-                            sharpe_ratio,
-                            win_rate,
-                            profit_loss_ratio,
-                            total_trades,
-                            plotly_json_str,
-                            report_id,
-                        ),
-                    )
-                    connection.commit()
+                    (
+                        final_fund,
+                        total_return,
+                        annual_return,
+                        max_drawdown,
+                        sharpe_ratio,
+                        win_rate,
+                        profit_loss_ratio,
+                        total_trades,
+                        plotly_json_str,
+                        report_id,
+                    ),
+                )
 
                 # 发送回测完成消息
                 create_message(
@@ -3694,27 +4319,25 @@ def start_backtest(current_user):
                     link_params=None,
                 )
 
-                logger.info(f"回测任务完成，报告ID: {report_id}")
+                logger.info("回测任务完成，报告ID: %s", report_id)
 
             except Exception as e:
-                logger.error(f"回测任务执行失败: {str(e)}")
+                logger.error("回测任务执行失败: %s", e)
 
                 # 更新失败状态
-                if connection:
+                if report_created:
                     try:
-                        with connection.cursor() as cursor:
-                            cursor.execute(
-                                """
+                        write_report(
+                            """
                                 UPDATE BacktestReport SET
                                     report_status = 'failed',
                                     error_message = %s
                                 WHERE report_id = %s
                             """,
-                                (str(e), report_id),
-                            )
-                            connection.commit()
+                            (str(e), report_id),
+                        )
                     except Exception as db_e:
-                        logger.error(f"更新失败状态时出错: {str(db_e)}")
+                        logger.error("更新失败状态时出错: %s", db_e)
 
                 # 发送失败消息
                 create_message(
@@ -3724,10 +4347,6 @@ def start_backtest(current_user):
                     content=f"策略 '{strategy_name}' 回测执行失败: {str(e)}",
                 )
 
-            finally:
-                if connection:
-                    connection.close()
-
         # 启动后台线程
         thread = threading.Thread(target=backtest_task)
         thread.daemon = True
@@ -3746,7 +4365,7 @@ def start_backtest(current_user):
         )
 
     except Exception as e:
-        logger.error(f"启动回测任务过程中发生错误: {str(e)}")
+        logger.error("启动回测任务过程中发生错误: %s", e)
         return jsonify({"message": f"启动回测任务失败: {str(e)}"}), 500
 
 
@@ -3814,7 +4433,7 @@ def get_backtest_list(current_user):
 
                     reports.append(processed_report)
                 except Exception as map_error:
-                    logger.error(f"映射回测记录失败: {str(map_error)}")
+                    logger.error("映射回测记录失败: %s", map_error)
                     continue
 
             return (
@@ -3837,7 +4456,7 @@ def get_backtest_list(current_user):
             connection.close()
 
     except Exception as e:
-        logger.error(f"获取回测列表过程中发生错误: {str(e)}")
+        logger.error("获取回测列表过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": f"获取回测列表失败: {str(e)}"}), 500
 
 
@@ -3947,7 +4566,7 @@ def get_backtest_report(current_user, report_id):
                         report["benchmark_index"]
                     )
                 except Exception as e:
-                    logger.warning(f"获取基准指数名称失败: {e}")
+                    logger.warning("获取基准指数名称失败: %s", e)
                     benchmark_name = report["benchmark_index"]  # 使用代码作为备用
 
             # 将基准名称添加到报告数据中
@@ -3966,11 +4585,11 @@ def get_backtest_report(current_user, report_id):
             # 处理plotly数据
             if report.get("plotly_chart_data"):
                 try:
-                    report["plotly_chart_data"] = json.loads(
+                    report["plotly_chart_data"] = json_loads(
                         report["plotly_chart_data"]
                     )
                 except json.JSONDecodeError:
-                    logger.warning(f"无法解析报告 {report_id} 的plotly数据")
+                    logger.warning("无法解析报告 %s 的plotly数据", report_id)
                     report["plotly_chart_data"] = None
 
             return jsonify({"success": True, "data": report}), 200
@@ -3979,7 +4598,7 @@ def get_backtest_report(current_user, report_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"获取回测报告过程中发生错误: {str(e)}")
+        logger.error("获取回测报告过程中发生错误: %s", e)
         return jsonify({"message": f"获取回测报告失败: {str(e)}"}), 500
 
 
@@ -4019,7 +4638,7 @@ def delete_backtest_report(current_user, report_id):
 
             if cursor.rowcount > 0:
                 logger.info(
-                    f"用户 {current_user['user_name']} 删除了回测报告 {report_id}"
+                    "用户 %s 删除了回测报告 %s", current_user["user_name"], report_id
                 )
                 return jsonify({"code": 200, "message": "回测报告删除成功"}), 200
             else:
@@ -4029,10 +4648,21 @@ def delete_backtest_report(current_user, report_id):
             connection.close()
 
     except Exception as e:
-        logger.error(f"删除回测报告过程中发生错误: {str(e)}")
+        logger.error("删除回测报告过程中发生错误: %s", e)
         return jsonify({"code": 500, "message": f"删除回测报告失败: {str(e)}"}), 500
 
 
+# 设置环境变量PROFILE=1时按请求输出cProfile结果，可用SnakeViz等工具查看
+if os.environ.get("PROFILE"):
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+
+    profile_dir = os.path.join(os.path.dirname(__file__), "profiler_results")
+    os.makedirs(profile_dir, exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(
+        app.wsgi_app, restrictions=[30], profile_dir=profile_dir
+    )
+
+
 if __name__ == "__main__":
     # 注意：在生产环境中，请使用适当的WSGI服务器（如Gunicorn）运行，而不是使用Flask的开发服务器
     # 同时，应将debug设置为False
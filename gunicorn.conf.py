@@ -0,0 +1,12 @@
+# Gunicorn配置文件，在项目根目录执行 `gunicorn app:app` 时自动加载
+import os
+
+bind = "0.0.0.0:5000"
+
+# gevent协程worker：等待MySQL返回期间切换到其他请求，单个进程即可并发处理大量请求
+worker_class = "gevent"
+worker_connections = 100
+
+# 每个worker进程各有一个数据库连接池（上限为config.json中的db_max_connections），
+# 进程数按CPU核数设置即可，过多的进程只会让MySQL连接数成倍增加
+workers = int(os.environ.get("GUNICORN_WORKERS", os.cpu_count() or 1))
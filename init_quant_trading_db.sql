@@ -15,7 +15,7 @@ USE quantitative_trading;
 -- 1. 创建用户表
 -- =============================================
 CREATE TABLE User (
-    user_id VARCHAR(50) NOT NULL COMMENT '用户唯一ID',
+    user_id CHAR(32) CHARACTER SET ascii COLLATE ascii_bin NOT NULL COMMENT '用户唯一ID（UUIDv7的32位十六进制串）',
     user_name VARCHAR(50) NOT NULL COMMENT '用户名（唯一，仅允许英文、数字、下划线，不能与Tushare表名重复）',
     user_password VARCHAR(255) NOT NULL COMMENT '用户密码（加密存储）',
     user_role ENUM('admin', 'analyst') NOT NULL DEFAULT 'analyst' COMMENT '用户角色',
@@ -30,12 +30,14 @@ CREATE TABLE User (
     user_last_login_time DATETIME COMMENT '最后登录时间',
     PRIMARY KEY (user_id),
     UNIQUE KEY uk_user_name (user_name),
-    INDEX idx_user_email (user_email)
+    UNIQUE KEY uk_user_email (user_email)
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COLLATE = utf8mb4_unicode_ci COMMENT = '用户信息表';
 
 -- =============================================
 -- 2. 创建指标表
 -- =============================================
+-- 指标、策略的名称/描述全文索引使用ngram分词，关闭停用词，避免含停用词字母的词元被丢弃
+SET SESSION innodb_ft_enable_stopword = OFF;
 
 CREATE TABLE Indicator (
     creator_name VARCHAR(50) NOT NULL COMMENT '指标创建者用户名，引用User.user_name',
@@ -46,14 +48,15 @@ CREATE TABLE Indicator (
     creation_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
     update_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
     PRIMARY KEY (creator_name, indicator_name),
-    INDEX idx_creator_name (creator_name),
     INDEX idx_is_active (is_active),
+    FULLTEXT INDEX ft_indicator_search (indicator_name, description) WITH PARSER ngram,
     CONSTRAINT fk_indicator_creator FOREIGN KEY (creator_name) REFERENCES User (user_name)
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COLLATE = utf8mb4_unicode_ci COMMENT = '技术/自定义指标定义表';
 
 -- =============================================
 -- 3. 创建策略表
 -- =============================================
+
 CREATE TABLE Strategy (
     creator_name VARCHAR(50) NOT NULL COMMENT '策略创建者用户名，引用User.user_name',
     strategy_name VARCHAR(100) NOT NULL COMMENT '策略名称',
@@ -75,9 +78,16 @@ CREATE TABLE Strategy (
     create_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
     update_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
     PRIMARY KEY (creator_name, strategy_name),
-    INDEX idx_creator_name (creator_name),
-    INDEX idx_scope_type (scope_type),
+    INDEX idx_creator_update (creator_name, update_time),
+    INDEX idx_public_update (public, update_time),
+    INDEX idx_scope_type_update (scope_type, update_time),
     INDEX idx_scope_id (scope_id),
+    INDEX idx_update_time (
+        update_time,
+        creator_name,
+        strategy_name
+    ),
+    FULLTEXT INDEX ft_strategy_search (strategy_name, strategy_desc) WITH PARSER ngram,
     CONSTRAINT fk_strategy_creator FOREIGN KEY (creator_name) REFERENCES User (user_name)
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COLLATE = utf8mb4_unicode_ci COMMENT = '选股策略表';
 
@@ -94,7 +104,8 @@ CREATE TABLE Param (
     agg_func VARCHAR(50) DEFAULT NULL COMMENT '聚合函数，如SMA、EMA、MAX等',
     creation_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
     update_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
-    PRIMARY KEY (creator_name, param_name)
+    PRIMARY KEY (creator_name, param_name),
+    INDEX idx_data_id_type (data_id, param_type)
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COLLATE = utf8mb4_unicode_ci COMMENT = '参数定义表';
 
 CREATE TABLE IndicatorParamRel (
@@ -111,11 +122,11 @@ CREATE TABLE IndicatorParamRel (
     CONSTRAINT fk_rel_indicator FOREIGN KEY (
         indicator_creator_name,
         indicator_name
-    ) REFERENCES Indicator (creator_name, indicator_name),
+    ) REFERENCES Indicator (creator_name, indicator_name) ON UPDATE CASCADE ON DELETE CASCADE,
     CONSTRAINT fk_rel_param_indicator FOREIGN KEY (
         param_creator_name,
         param_name
-    ) REFERENCES Param (creator_name, param_name)
+    ) REFERENCES Param (creator_name, param_name) ON UPDATE CASCADE
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COLLATE = utf8mb4_unicode_ci COMMENT = '指标与参数关系表';
 
 CREATE TABLE StrategyParamRel (
@@ -132,11 +143,11 @@ CREATE TABLE StrategyParamRel (
     CONSTRAINT fk_rel_strategy FOREIGN KEY (
         strategy_creator_name,
         strategy_name
-    ) REFERENCES Strategy (creator_name, strategy_name),
+    ) REFERENCES Strategy (creator_name, strategy_name) ON UPDATE CASCADE ON DELETE CASCADE,
     CONSTRAINT fk_rel_param_strategy FOREIGN KEY (
         param_creator_name,
         param_name
-    ) REFERENCES Param (creator_name, param_name)
+    ) REFERENCES Param (creator_name, param_name) ON UPDATE CASCADE
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COLLATE = utf8mb4_unicode_ci COMMENT = '策略与参数关系表';
 
 -- =============================================
@@ -157,7 +168,7 @@ CREATE TABLE TradingSignal (
     INDEX idx_stock_trade_date (stock_code, trade_date),
     INDEX idx_strategy (creator_name, strategy_name),
     CONSTRAINT fk_signal_user FOREIGN KEY (user_name) REFERENCES User (user_name),
-    CONSTRAINT fk_signal_strategy FOREIGN KEY (creator_name, strategy_name) REFERENCES Strategy (creator_name, strategy_name)
+    CONSTRAINT fk_signal_strategy FOREIGN KEY (creator_name, strategy_name) REFERENCES Strategy (creator_name, strategy_name) ON UPDATE CASCADE ON DELETE CASCADE
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COLLATE = utf8mb4_unicode_ci COMMENT = '交易信号表';
 
 -- =============================================
@@ -196,7 +207,7 @@ CREATE TABLE BacktestReport (
         report_generate_time
     ),
     INDEX idx_user_name (user_name),
-    CONSTRAINT fk_report_strategy FOREIGN KEY (creator_name, strategy_name) REFERENCES Strategy (creator_name, strategy_name),
+    CONSTRAINT fk_report_strategy FOREIGN KEY (creator_name, strategy_name) REFERENCES Strategy (creator_name, strategy_name) ON UPDATE CASCADE,
     CONSTRAINT fk_report_user FOREIGN KEY (user_name) REFERENCES User (user_name),
     CONSTRAINT chk_date_range CHECK (end_date >= start_date),
     CONSTRAINT chk_funds CHECK (
@@ -342,6 +342,148 @@ class IndicatorManagementTester:
             print(f"❌ 删除指标异常: {e}")
             return False
 
+    def list_indicators(self, **query):
+        """按给定查询参数获取指标列表，返回完整响应体"""
+        response = self.session.get(
+            f"{BASE_URL}/api/indicators", params=query, headers=self.get_headers()
+        )
+        if response.status_code != 200:
+            print(f"❌ 获取指标列表失败，状态码: {response.status_code}")
+            return None
+        return response.json()
+
+    def test_cursor_pagination(self):
+        """测试游标分页与页码分页结果一致"""
+        print("11. 测试游标分页...")
+        try:
+            limit = 5
+            max_pages = 3
+
+            # 页码分页取前几页
+            offset_ids = []
+            for page in range(1, max_pages + 1):
+                result = self.list_indicators(page=page, limit=limit)
+                if result is None:
+                    return False
+                offset_ids.extend(
+                    f"{i['creator_name']}.{i['indicator_name']}"
+                    for i in result.get("data", [])
+                )
+
+            # 从第一页开始沿next_cursor翻页
+            cursor_ids = []
+            result = self.list_indicators(limit=limit)
+            for _ in range(max_pages):
+                if result is None:
+                    return False
+                cursor_ids.extend(
+                    f"{i['creator_name']}.{i['indicator_name']}"
+                    for i in result.get("data", [])
+                )
+                next_cursor = result.get("pagination", {}).get("next_cursor")
+                if not next_cursor:
+                    break
+                result = self.list_indicators(limit=limit, cursor=next_cursor)
+
+            if cursor_ids == offset_ids:
+                print(f"✓ 游标分页与页码分页结果一致，共比较 {len(cursor_ids)} 个指标")
+                return True
+            else:
+                print(f"❌ 游标分页结果不一致: {cursor_ids} != {offset_ids}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 游标分页测试异常: {e}")
+            return False
+
+    def test_invalid_cursor(self):
+        """测试无效的分页游标"""
+        print("12. 测试无效的分页游标...")
+        try:
+            response = self.session.get(
+                f"{BASE_URL}/api/indicators",
+                params={"cursor": "not_a_valid_cursor!"},
+                headers=self.get_headers(),
+            )
+
+            if response.status_code == 400:
+                result = response.json()
+                print(f"✓ 无效游标正确被拒绝: {result.get('message')}")
+                return True
+            else:
+                print(f"❌ 无效游标未被拒绝，状态码: {response.status_code}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 无效游标测试异常: {e}")
+            return False
+
+    def test_list_without_total(self):
+        """测试include_total=0时不统计总数"""
+        print("13. 测试不统计总数...")
+        try:
+            result = self.list_indicators(include_total=0)
+            if result is None:
+                return False
+
+            total = result.get("pagination", {}).get("total")
+            if total is None:
+                print("✓ include_total=0时未返回总数")
+                return True
+            else:
+                print(f"❌ include_total=0时仍返回总数: {total}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 不统计总数测试异常: {e}")
+            return False
+
+    def test_created_indicator_in_list(self):
+        """测试新建指标后立即出现在列表中"""
+        print("14. 测试新建指标后列表立即更新...")
+        indicator_name = f"{self.test_indicator_name}_list"
+        try:
+            # 先查询一次，使列表结果进入缓存
+            if self.list_indicators(creator_name="system", limit=100) is None:
+                return False
+
+            indicator_data = {
+                "indicator_name": indicator_name,
+                "calculation_method": "def calculation_method(params):\n    return params['system.close']",
+                "description": "列表缓存测试指标",
+                "is_active": True,
+            }
+            response = self.session.post(
+                f"{BASE_URL}/api/indicators",
+                json=indicator_data,
+                headers=self.get_headers(),
+            )
+            if response.status_code != 201:
+                print(f"❌ 指标创建失败: {response.json().get('message')}")
+                return False
+
+            result = self.list_indicators(creator_name="system", limit=100)
+            if result is None:
+                return False
+            names = [i["indicator_name"] for i in result.get("data", [])]
+
+            if indicator_name in names:
+                print(f"✓ 新建指标已出现在列表中: {indicator_name}")
+                return True
+            else:
+                print(f"❌ 新建指标未出现在列表中: {names}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 新建指标列表测试异常: {e}")
+            return False
+        finally:
+            # 清理测试数据
+            self.session.delete(
+                f"{BASE_URL}/api/indicators/system.{indicator_name}",
+                headers=self.get_headers(),
+            )
+
     def run_all_tests(self):
         """运行所有测试"""
         print("🚀 开始指标管理API测试...\n")
@@ -365,6 +507,10 @@ class IndicatorManagementTester:
             self.test_delete_indicator_param_relation,
             self.test_create_duplicate_indicator,
             self.test_delete_indicator,
+            self.test_cursor_pagination,
+            self.test_invalid_cursor,
+            self.test_list_without_total,
+            self.test_created_indicator_in_list,
         ]
 
         for test_method in test_methods:
@@ -317,6 +317,164 @@ class ParamManagementTester:
             print(f"❌ 删除不存在参数测试异常: {e}")
             return False
 
+    def list_params(self, **query):
+        """按给定查询参数获取参数列表，返回响应中的data部分"""
+        response = self.session.get(
+            f"{BASE_URL}/api/params", params=query, headers=self.get_headers()
+        )
+        if response.status_code != 200:
+            print(f"❌ 获取参数列表失败，状态码: {response.status_code}")
+            return None
+        return response.json().get("data", {})
+
+    def test_cursor_pagination(self):
+        """测试游标分页与页码分页结果一致"""
+        print("9. 测试游标分页...")
+        try:
+            page_size = 5
+            max_pages = 3
+
+            # 页码分页取前几页
+            offset_ids = []
+            for page in range(1, max_pages + 1):
+                data = self.list_params(
+                    param_type="all", page=page, page_size=page_size
+                )
+                if data is None:
+                    return False
+                offset_ids.extend(p["id"] for p in data.get("params", []))
+
+            # 从第一页开始沿next_cursor翻页
+            cursor_ids = []
+            data = self.list_params(param_type="all", page_size=page_size)
+            for _ in range(max_pages):
+                if data is None:
+                    return False
+                cursor_ids.extend(p["id"] for p in data.get("params", []))
+                next_cursor = data.get("next_cursor")
+                if not next_cursor:
+                    break
+                data = self.list_params(
+                    param_type="all", page_size=page_size, cursor=next_cursor
+                )
+
+            if cursor_ids == offset_ids:
+                print(f"✓ 游标分页与页码分页结果一致，共比较 {len(cursor_ids)} 个参数")
+                return True
+            else:
+                print(f"❌ 游标分页结果不一致: {cursor_ids} != {offset_ids}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 游标分页测试异常: {e}")
+            return False
+
+    def test_invalid_cursor(self):
+        """测试无效的分页游标"""
+        print("10. 测试无效的分页游标...")
+        try:
+            response = self.session.get(
+                f"{BASE_URL}/api/params",
+                params={"cursor": "not_a_valid_cursor!"},
+                headers=self.get_headers(),
+            )
+
+            if response.status_code == 400:
+                result = response.json()
+                print(f"✓ 无效游标正确被拒绝: {result.get('message')}")
+                return True
+            else:
+                print(f"❌ 无效游标未被拒绝，状态码: {response.status_code}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 无效游标测试异常: {e}")
+            return False
+
+    def test_list_without_total(self):
+        """测试include_total=0时不统计总数"""
+        print("11. 测试不统计总数...")
+        try:
+            data = self.list_params(include_total=0)
+            if data is None:
+                return False
+
+            if data.get("total") is None:
+                print("✓ include_total=0时未返回总数")
+                return True
+            else:
+                print(f"❌ include_total=0时仍返回总数: {data.get('total')}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 不统计总数测试异常: {e}")
+            return False
+
+    def test_page_size_limit(self):
+        """测试单页条数上限"""
+        print("12. 测试单页条数上限...")
+        try:
+            data = self.list_params(page_size=100000)
+            if data is None:
+                return False
+
+            if data.get("page_size") == 1000 and len(data.get("params", [])) <= 1000:
+                print("✓ 过大的page_size被限制为1000")
+                return True
+            else:
+                print(f"❌ page_size未被限制: {data.get('page_size')}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 单页条数上限测试异常: {e}")
+            return False
+
+    def test_created_param_in_list(self):
+        """测试新建参数后立即出现在列表中"""
+        print("13. 测试新建参数后列表立即更新...")
+        param_name = f"{self.test_param_name}_list"
+        try:
+            # 先查询一次，使列表结果进入缓存
+            if self.list_params(param_type="my", search=param_name) is None:
+                return False
+
+            param_data = {
+                "param_name": param_name,
+                "data_id": "daily.close",
+                "param_type": "table",
+                "pre_period": 5,
+                "post_period": 0,
+                "agg_func": "SMA",
+            }
+            response = self.session.post(
+                f"{BASE_URL}/api/params", json=param_data, headers=self.get_headers()
+            )
+            if response.status_code != 201:
+                print(f"❌ 参数创建失败: {response.json().get('message')}")
+                return False
+
+            data = self.list_params(param_type="my", search=param_name)
+            if data is None:
+                return False
+            names = [p["param_name"] for p in data.get("params", [])]
+
+            if param_name in names:
+                print(f"✓ 新建参数已出现在列表中: {param_name}")
+                return True
+            else:
+                print(f"❌ 新建参数未出现在列表中: {names}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 新建参数列表测试异常: {e}")
+            return False
+        finally:
+            # 清理测试数据
+            self.session.delete(
+                f"{BASE_URL}/api/params/system.{param_name}",
+                headers=self.get_headers(),
+            )
+
     def run_all_tests(self):
         """运行所有测试"""
         print("🚀 开始参数管理API测试...\n")
@@ -338,6 +496,11 @@ class ParamManagementTester:
             self.test_update_nonexistent_param,
             self.test_delete_param,
             self.test_delete_nonexistent_param,
+            self.test_cursor_pagination,
+            self.test_invalid_cursor,
+            self.test_list_without_total,
+            self.test_page_size_limit,
+            self.test_created_param_in_list,
         ]
 
         for test_method in test_methods:
@@ -357,6 +357,166 @@ class StrategyManagementTester:
             print(f"❌ 删除策略异常: {e}")
             return False
 
+    def list_strategies(self, **query):
+        """按给定查询参数获取策略列表，返回响应中的data部分"""
+        response = self.session.get(
+            f"{BASE_URL}/api/strategies", params=query, headers=self.get_headers()
+        )
+        result = response.json()
+        if result.get("code") != 200:
+            print(f"❌ 获取策略列表失败: {result.get('message')}")
+            return None
+        return result.get("data", {})
+
+    def test_cursor_pagination(self):
+        """测试游标分页与页码分页结果一致"""
+        print("11. 测试游标分页...")
+        try:
+            page_size = 5
+            max_pages = 3
+
+            # 页码分页取前几页
+            offset_ids = []
+            for page in range(1, max_pages + 1):
+                data = self.list_strategies(
+                    strategy_type="all", page=page, page_size=page_size
+                )
+                if data is None:
+                    return False
+                offset_ids.extend(
+                    f"{s['creator_name']}.{s['strategy_name']}"
+                    for s in data.get("strategies", [])
+                )
+
+            # 从第一页开始沿next_cursor翻页
+            cursor_ids = []
+            data = self.list_strategies(strategy_type="all", page_size=page_size)
+            for _ in range(max_pages):
+                if data is None:
+                    return False
+                cursor_ids.extend(
+                    f"{s['creator_name']}.{s['strategy_name']}"
+                    for s in data.get("strategies", [])
+                )
+                next_cursor = data.get("next_cursor")
+                if not next_cursor:
+                    break
+                data = self.list_strategies(
+                    strategy_type="all", page_size=page_size, cursor=next_cursor
+                )
+
+            if cursor_ids == offset_ids:
+                print(f"✓ 游标分页与页码分页结果一致，共比较 {len(cursor_ids)} 个策略")
+                return True
+            else:
+                print(f"❌ 游标分页结果不一致: {cursor_ids} != {offset_ids}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 游标分页测试异常: {e}")
+            return False
+
+    def test_invalid_cursor(self):
+        """测试无效的分页游标"""
+        print("12. 测试无效的分页游标...")
+        try:
+            response = self.session.get(
+                f"{BASE_URL}/api/strategies",
+                params={"cursor": "not_a_valid_cursor!"},
+                headers=self.get_headers(),
+            )
+
+            result = response.json()
+            if result.get("code") == 400:
+                print(f"✓ 无效游标正确被拒绝: {result.get('message')}")
+                return True
+            else:
+                print(f"❌ 无效游标未被拒绝，返回码: {result.get('code')}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 无效游标测试异常: {e}")
+            return False
+
+    def test_list_without_total(self):
+        """测试include_total=0时不统计总数"""
+        print("13. 测试不统计总数...")
+        try:
+            data = self.list_strategies(include_total=0)
+            if data is None:
+                return False
+
+            if data.get("total") is None:
+                print("✓ include_total=0时未返回总数")
+                return True
+            else:
+                print(f"❌ include_total=0时仍返回总数: {data.get('total')}")
+                return False
+
+        except Exception as e:
+            print(f"❌ 不统计总数测试异常: {e}")
+            return False
+
+    def test_created_strategy_in_list(self):
+        """测试新建策略后立即出现在列表中"""
+        print("14. 测试新建策略后列表立即更新...")
+        strategy_name = f"{self.test_strategy_name}_list"
+        try:
+            # 系统策略列表无搜索词时会被缓存，先查询一次使其进入缓存
+            before = self.list_strategies(strategy_type="system", page_size=100)
+            if before is None:
+                return False
+
+            strategy_data = {
+                "strategy_name": strategy_name,
+                "public": False,
+                "scope_type": "all",
+                "benchmark_index": "000300.SH",
+                "select_func": "def select_func(candidates, params, position_count, current_holdings, date, context=None):\n    return candidates[:1]",
+                "position_count": 1,
+                "rebalance_interval": 1,
+                "buy_fee_rate": 0.0003,
+                "sell_fee_rate": 0.0013,
+                "strategy_desc": "列表缓存测试策略",
+            }
+            response = self.session.post(
+                f"{BASE_URL}/api/strategies",
+                json=strategy_data,
+                headers=self.get_headers(),
+            )
+            result = response.json()
+            if result.get("code") != 200:
+                print(f"❌ 策略创建失败: {result.get('message')}")
+                return False
+
+            after = self.list_strategies(strategy_type="system", page_size=100)
+            if after is None:
+                return False
+            names = [s["strategy_name"] for s in after.get("strategies", [])]
+
+            if strategy_name not in names:
+                print(f"❌ 新建策略未出现在列表中: {names}")
+                return False
+            if (
+                before.get("total") is not None
+                and after.get("total") != before["total"] + 1
+            ):
+                print(f"❌ 策略总数未更新: {before['total']} -> {after.get('total')}")
+                return False
+
+            print(f"✓ 新建策略已出现在列表中，总数同步更新: {strategy_name}")
+            return True
+
+        except Exception as e:
+            print(f"❌ 新建策略列表测试异常: {e}")
+            return False
+        finally:
+            # 清理测试数据
+            self.session.delete(
+                f"{BASE_URL}/api/strategies/system/{strategy_name}",
+                headers=self.get_headers(),
+            )
+
     def run_all_tests(self):
         """运行所有测试"""
         print("🚀 开始策略管理API测试...\n")
@@ -380,6 +540,10 @@ class StrategyManagementTester:
             self.test_remove_strategy_param,
             self.test_create_duplicate_strategy,
             self.test_delete_strategy,
+            self.test_cursor_pagination,
+            self.test_invalid_cursor,
+            self.test_list_without_total,
+            self.test_created_strategy_in_list,
         ]
 
         for test_method in test_methods:
@@ -0,0 +1,95 @@
+-- =============================================
+-- 量化交易系统数据库升级脚本
+-- 数据库：MySQL 8.0+
+-- 适用于按旧版init_quant_trading_db.sql建好的已有数据库，新建数据库无需执行
+-- =============================================
+
+USE quantitative_trading;
+
+-- =============================================
+-- 1. 指标、策略搜索使用的全文索引
+-- =============================================
+-- 指标、策略的名称/描述全文索引使用ngram分词，关闭停用词，避免含停用词字母的词元被丢弃
+-- 未建此索引时，两个字符以上的关键词搜索会报错1191
+SET SESSION innodb_ft_enable_stopword = OFF;
+
+ALTER TABLE Indicator
+ADD FULLTEXT INDEX ft_indicator_search (indicator_name, description) WITH PARSER ngram;
+
+ALTER TABLE Strategy
+ADD FULLTEXT INDEX ft_strategy_search (strategy_name, strategy_desc) WITH PARSER ngram;
+
+-- =============================================
+-- 2. 用户表：邮箱唯一、用户ID改为32位十六进制串
+-- =============================================
+-- 注册接口依赖uk_user_email判断邮箱是否重复，执行前先确认下列查询没有结果，有则先处理重复邮箱
+-- SELECT user_email, COUNT(*) FROM User WHERE user_email IS NOT NULL GROUP BY user_email HAVING COUNT(*) > 1;
+ALTER TABLE User DROP INDEX idx_user_email, ADD UNIQUE KEY uk_user_email (user_email);
+
+-- 去掉旧UUID中的连字符后缩短列类型；升级前签发的token中的用户ID仍带连字符，用户需重新登录
+UPDATE User SET user_id = REPLACE(user_id, '-', '');
+
+ALTER TABLE User
+MODIFY user_id CHAR(32) CHARACTER SET ascii COLLATE ascii_bin NOT NULL COMMENT '用户唯一ID（UUIDv7的32位十六进制串）';
+
+-- =============================================
+-- 3. 外键级联：重命名、删除指标/策略/参数时由数据库同步更新关联行
+-- =============================================
+-- 同一条ALTER中不能删除后重建同名外键，分两步执行
+ALTER TABLE IndicatorParamRel
+DROP FOREIGN KEY fk_rel_indicator,
+DROP FOREIGN KEY fk_rel_param_indicator;
+
+ALTER TABLE IndicatorParamRel
+ADD CONSTRAINT fk_rel_indicator FOREIGN KEY (
+    indicator_creator_name,
+    indicator_name
+) REFERENCES Indicator (creator_name, indicator_name) ON UPDATE CASCADE ON DELETE CASCADE,
+ADD CONSTRAINT fk_rel_param_indicator FOREIGN KEY (
+    param_creator_name,
+    param_name
+) REFERENCES Param (creator_name, param_name) ON UPDATE CASCADE;
+
+ALTER TABLE StrategyParamRel
+DROP FOREIGN KEY fk_rel_strategy,
+DROP FOREIGN KEY fk_rel_param_strategy;
+
+ALTER TABLE StrategyParamRel
+ADD CONSTRAINT fk_rel_strategy FOREIGN KEY (
+    strategy_creator_name,
+    strategy_name
+) REFERENCES Strategy (creator_name, strategy_name) ON UPDATE CASCADE ON DELETE CASCADE,
+ADD CONSTRAINT fk_rel_param_strategy FOREIGN KEY (
+    param_creator_name,
+    param_name
+) REFERENCES Param (creator_name, param_name) ON UPDATE CASCADE;
+
+ALTER TABLE TradingSignal DROP FOREIGN KEY fk_signal_strategy;
+
+ALTER TABLE TradingSignal
+ADD CONSTRAINT fk_signal_strategy FOREIGN KEY (creator_name, strategy_name) REFERENCES Strategy (creator_name, strategy_name) ON UPDATE CASCADE ON DELETE CASCADE;
+
+ALTER TABLE BacktestReport DROP FOREIGN KEY fk_report_strategy;
+
+ALTER TABLE BacktestReport
+ADD CONSTRAINT fk_report_strategy FOREIGN KEY (creator_name, strategy_name) REFERENCES Strategy (creator_name, strategy_name) ON UPDATE CASCADE;
+
+-- =============================================
+-- 4. 列表查询使用的索引
+-- =============================================
+-- 外键所需的creator_name索引由主键和新的组合索引最左列提供，单列索引不再需要
+ALTER TABLE Indicator DROP INDEX idx_creator_name;
+
+ALTER TABLE Strategy
+ADD INDEX idx_creator_update (creator_name, update_time),
+ADD INDEX idx_public_update (public, update_time),
+ADD INDEX idx_scope_type_update (scope_type, update_time),
+ADD INDEX idx_update_time (
+    update_time,
+    creator_name,
+    strategy_name
+),
+DROP INDEX idx_creator_name,
+DROP INDEX idx_scope_type;
+
+ALTER TABLE Param ADD INDEX idx_data_id_type (data_id, param_type);